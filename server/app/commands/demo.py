@@ -28,7 +28,7 @@ from ..extensions import db
 from ..models.category import MenuCategory
 from ..models.menu import Menu, MenuItem
 from ..models.restaurant import Restaurant
-from ..models.user import User
+from ..models.user import PASSWORD_HASH_METHOD, User
 from ..routes.helpers import get_or_create_dish
 
 _DEMO_CODE = 'DEMO'
@@ -213,7 +213,7 @@ def _ensure_demo_user(password: str, restaurant_id: int) -> User:
         user = User(
             email=_DEMO_EMAIL,
             username='demo',
-            password_hash=generate_password_hash(password),
+            password_hash=generate_password_hash(password, method=PASSWORD_HASH_METHOD),
             role='admin',
             is_active=True,
             mfa_enabled=False,
@@ -222,7 +222,7 @@ def _ensure_demo_user(password: str, restaurant_id: int) -> User:
         db.session.add(user)
         click.echo(f'  ✓ Utilisateur demo créé ({_DEMO_EMAIL})')
     else:
-        user.password_hash = generate_password_hash(password)
+        user.password_hash = generate_password_hash(password, method=PASSWORD_HASH_METHOD)
         user.is_active = True
         user.mfa_enabled = False
         click.echo(f'  ✓ Mot de passe demo réinitialisé ({_DEMO_EMAIL})')
@@ -7,6 +7,8 @@ data is updated and missing data is inserted. Keywords are replaced in full.
 Usage:
     docker compose exec backend flask seed
 """
+from collections.abc import Mapping
+
 import click
 
 from ..data.taxonomy import (
@@ -55,10 +57,10 @@ def _upsert_dietary_tag_categories() -> int:
     count = 0
     for data in DIETARY_TAG_CATEGORIES:
         obj = DietaryTagCategory(
-            id=data['id'],
-            name=data['name'],
-            color=data.get('color'),
-            sort_order=data.get('sort_order', 0),
+            id=data.id,
+            name=data.name,
+            color=data.color,
+            sort_order=data.sort_order,
         )
         db.session.merge(obj)
         count += 1
@@ -69,12 +71,12 @@ def _upsert_dietary_tags() -> int:
     count = 0
     for data in DIETARY_TAGS:
         obj = DietaryTag(
-            id=data['id'],
-            label=data['label'],
-            icon=data['icon'],
-            color=data['color'],
-            category_id=data['category_id'],
-            sort_order=data.get('sort_order', 0),
+            id=data.id,
+            label=data.label,
+            icon=data.icon,
+            color=data.color,
+            category_id=data.category_id,
+            sort_order=data.sort_order,
         )
         db.session.merge(obj)
         count += 1
@@ -83,23 +85,16 @@ def _upsert_dietary_tags() -> int:
 
 def _upsert_dietary_tag_keywords() -> int:
     """Replace all keywords for each tag (delete + re-insert)."""
-    db.session.flush()
-    total = 0
-    for tag_id, keywords in DIETARY_TAG_KEYWORDS.items():
-        DietaryTagKeyword.query.filter_by(tag_id=tag_id).delete()
-        for kw in keywords:
-            db.session.add(DietaryTagKeyword(tag_id=tag_id, keyword=kw))
-            total += 1
-    return total
+    return _replace_keywords(DietaryTagKeyword, 'tag_id', DIETARY_TAG_KEYWORDS)
 
 
 def _upsert_certification_categories() -> int:
     count = 0
     for data in CERTIFICATION_CATEGORIES:
         obj = CertificationCategory(
-            id=data['id'],
-            name=data['name'],
-            sort_order=data.get('sort_order', 0),
+            id=data.id,
+            name=data.name,
+            sort_order=data.sort_order,
         )
         db.session.merge(obj)
         count += 1
@@ -110,16 +105,16 @@ def _upsert_certifications() -> int:
     count = 0
     for data in CERTIFICATIONS:
         obj = Certification(
-            id=data['id'],
-            name=data['name'],
-            official_name=data['official_name'],
-            issuer=data['issuer'],
-            scheme_type=data['scheme_type'],
-            jurisdiction=data['jurisdiction'],
-            guarantee=data.get('guarantee'),
-            logo_filename=data['logo_filename'],
-            category_id=data['category_id'],
-            sort_order=data.get('sort_order', 0),
+            id=data.id,
+            name=data.name,
+            official_name=data.official_name,
+            issuer=data.issuer,
+            scheme_type=data.scheme_type,
+            jurisdiction=data.jurisdiction,
+            guarantee=data.guarantee,
+            logo_filename=data.logo_filename,
+            category_id=data.category_id,
+            sort_order=data.sort_order,
         )
         db.session.merge(obj)
         count += 1
@@ -128,11 +123,20 @@ def _upsert_certifications() -> int:
 
 def _upsert_certification_keywords() -> int:
     """Replace all keywords for each certification (delete + re-insert)."""
+    return _replace_keywords(CertificationKeyword, 'certification_id', CERTIFICATION_KEYWORDS)
+
+
+def _replace_keywords(model, fk: str, keywords_by_id: Mapping[str, tuple[str, ...]]) -> int:
+    """One DELETE and one executemany INSERT for the whole table, not a
+    DELETE per parent plus an ORM object per keyword."""
     db.session.flush()
-    total = 0
-    for cert_id, keywords in CERTIFICATION_KEYWORDS.items():
-        CertificationKeyword.query.filter_by(certification_id=cert_id).delete()
-        for kw in keywords:
-            db.session.add(CertificationKeyword(certification_id=cert_id, keyword=kw))
-            total += 1
-    return total
+    column = getattr(model, fk)
+    model.query.filter(column.in_(list(keywords_by_id))).delete(synchronize_session=False)
+    rows = [
+        {fk: parent_id, 'keyword': kw}
+        for parent_id, keywords in keywords_by_id.items()
+        for kw in keywords
+    ]
+    if rows:
+        db.session.execute(db.insert(model), rows)
+    return len(rows)
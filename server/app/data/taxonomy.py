@@ -6,70 +6,116 @@ CE FICHIER EST LA SOURCE DE VÉRITÉ.
 Les tables DB sont peuplées à partir de ces données lors de la migration
 initiale. Elles servent ensuite de référentiel pour les FK.
 """
-from typing import Any
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import NamedTuple
+
+
+def _freeze_keywords(keywords: dict[str, list[str]]) -> Mapping[str, tuple[str, ...]]:
+    """Fige une table de mots-clés : minuscules, plus longs d'abord, lecture seule."""
+    return MappingProxyType({
+        key: tuple(sorted((kw.lower() for kw in kws), key=len, reverse=True))
+        for key, kws in keywords.items()
+    })
+
+
+class TagCategory(NamedTuple):
+    id: str
+    name: str
+    color: str | None = None
+    sort_order: int = 0
+
+
+class Tag(NamedTuple):
+    id: str
+    label: str
+    icon: str
+    color: str
+    category_id: str
+    sort_order: int = 0
+
+
+class CertCategory(NamedTuple):
+    id: str
+    name: str
+    sort_order: int = 0
+
+
+class Cert(NamedTuple):
+    id: str
+    name: str
+    official_name: str
+    issuer: str
+    scheme_type: str
+    jurisdiction: str
+    logo_filename: str
+    category_id: str
+    guarantee: str | None = None
+    sort_order: int = 0
+
 
 # ──────────────────────────────────────────────────────────────────────
 #  CATÉGORIES DE TAGS ALIMENTAIRES
 # ──────────────────────────────────────────────────────────────────────
 
-DIETARY_TAG_CATEGORIES = [
-    {
-        "id": "regime_composition",
-        "name": "Régime / composition",
-        "color": "green",
-        "sort_order": 1,
-    },
-    {
-        "id": "exclusions",
-        "name": "Allergènes / exclusions",
-        "color": "amber",
-        "sort_order": 2,
-    },
-    {
-        "id": "preparation",
-        "name": "Préparation",
-        "color": "blue",
-        "sort_order": 3,
-    },
-    {
-        "id": "taste_profile",
-        "name": "Goût / profil",
-        "color": "orange",
-        "sort_order": 4,
-    },
-]
+DIETARY_TAG_CATEGORIES: tuple[TagCategory, ...] = (
+    TagCategory(
+        id="regime_composition",
+        name="Régime / composition",
+        color="green",
+        sort_order=1,
+    ),
+    TagCategory(
+        id="exclusions",
+        name="Allergènes / exclusions",
+        color="amber",
+        sort_order=2,
+    ),
+    TagCategory(
+        id="preparation",
+        name="Préparation",
+        color="blue",
+        sort_order=3,
+    ),
+    TagCategory(
+        id="taste_profile",
+        name="Goût / profil",
+        color="orange",
+        sort_order=4,
+    ),
+)
 
 # ──────────────────────────────────────────────────────────────────────
 #  TAGS ALIMENTAIRES (déclaratifs, pas de certification externe)
 # ──────────────────────────────────────────────────────────────────────
 
-DIETARY_TAGS: list[dict[str, Any]] = [
+DIETARY_TAGS: tuple[Tag, ...] = (
     # ── Régime / composition ──
-    {"id": "vegetarian",      "label": "Végétarien",           "icon": "leaf",         "color": "green",  "category_id": "regime_composition", "sort_order": 1},
-    {"id": "vegan",           "label": "Vegan",                "icon": "sprout",       "color": "green",  "category_id": "regime_composition", "sort_order": 2},
-    {"id": "pescetarian",     "label": "Pescetarien",          "icon": "fish",         "color": "blue",   "category_id": "regime_composition", "sort_order": 3},
-    {"id": "halal",           "label": "Halal (déclaratif)",   "icon": "badge-check",  "color": "teal",   "category_id": "regime_composition", "sort_order": 4},
-    {"id": "pork_free",       "label": "Sans porc",            "icon": "ban",          "color": "orange", "category_id": "regime_composition", "sort_order": 5},
-    {"id": "alcohol_free",    "label": "Sans alcool",          "icon": "wine-off",     "color": "purple", "category_id": "regime_composition", "sort_order": 6},
+    Tag(id="vegetarian",      label="Végétarien",           icon="leaf",         color="green",  category_id="regime_composition", sort_order=1),
+    Tag(id="vegan",           label="Vegan",                icon="sprout",       color="green",  category_id="regime_composition", sort_order=2),
+    Tag(id="pescetarian",     label="Pescetarien",          icon="fish",         color="blue",   category_id="regime_composition", sort_order=3),
+    Tag(id="halal",           label="Halal (déclaratif)",   icon="badge-check",  color="teal",   category_id="regime_composition", sort_order=4),
+    Tag(id="pork_free",       label="Sans porc",            icon="ban",          color="orange", category_id="regime_composition", sort_order=5),
+    Tag(id="alcohol_free",    label="Sans alcool",          icon="wine-off",     color="purple", category_id="regime_composition", sort_order=6),
     # ── Exclusions simplifiées ──
-    {"id": "gluten_free",     "label": "Sans gluten",          "icon": "wheat-off",    "color": "amber",  "category_id": "exclusions",         "sort_order": 7},
-    {"id": "lactose_free",    "label": "Sans lactose",         "icon": "milk-off",     "color": "blue",   "category_id": "exclusions",         "sort_order": 8},
-    {"id": "nut_free",        "label": "Sans fruits à coque",  "icon": "nut-off",      "color": "amber",  "category_id": "exclusions",         "sort_order": 9},
+    Tag(id="gluten_free",     label="Sans gluten",          icon="wheat-off",    color="amber",  category_id="exclusions",         sort_order=7),
+    Tag(id="lactose_free",    label="Sans lactose",         icon="milk-off",     color="blue",   category_id="exclusions",         sort_order=8),
+    Tag(id="nut_free",        label="Sans fruits à coque",  icon="nut-off",      color="amber",  category_id="exclusions",         sort_order=9),
     # ── Préparation ──
-    {"id": "homemade",        "label": "Fait maison",          "icon": "chef-hat",     "color": "blue",   "category_id": "preparation",        "sort_order": 10},
-    {"id": "chef_special",    "label": "Plat du chef",         "icon": "sparkles",     "color": "indigo", "category_id": "preparation",        "sort_order": 11},
-    {"id": "traditional",     "label": "Recette traditionnelle","icon": "notebook-pen", "color": "orange", "category_id": "preparation",        "sort_order": 12},
-    {"id": "local_product",   "label": "Produit local",        "icon": "map-pin",      "color": "blue",   "category_id": "preparation",        "sort_order": 13},
-    {"id": "seasonal",        "label": "Produit de saison",    "icon": "tree-pine",    "color": "green",  "category_id": "preparation",        "sort_order": 14},
-    {"id": "hot_appetizer",   "label": "Entrée chaude",        "icon": "soup",         "color": "orange", "category_id": "preparation",        "sort_order": 15},
+    Tag(id="homemade",        label="Fait maison",          icon="chef-hat",     color="blue",   category_id="preparation",        sort_order=10),
+    Tag(id="chef_special",    label="Plat du chef",         icon="sparkles",     color="indigo", category_id="preparation",        sort_order=11),
+    Tag(id="traditional",     label="Recette traditionnelle",icon="notebook-pen", color="orange", category_id="preparation",        sort_order=12),
+    Tag(id="local_product",   label="Produit local",        icon="map-pin",      color="blue",   category_id="preparation",        sort_order=13),
+    Tag(id="seasonal",        label="Produit de saison",    icon="tree-pine",    color="green",  category_id="preparation",        sort_order=14),
+    Tag(id="hot_appetizer",   label="Entrée chaude",        icon="soup",         color="orange", category_id="preparation",        sort_order=15),
     # ── Goût / profil ──
-    {"id": "spicy",           "label": "Épicé",                "icon": "flame",        "color": "red",    "category_id": "taste_profile",      "sort_order": 15},
-    {"id": "low_salt",        "label": "Peu salé",             "icon": "droplets",     "color": "cyan",   "category_id": "taste_profile",      "sort_order": 16},
-    {"id": "sweet_savory",    "label": "Sucré-salé",           "icon": "candy",        "color": "pink",   "category_id": "taste_profile",      "sort_order": 17},
-]
+    Tag(id="spicy",           label="Épicé",                icon="flame",        color="red",    category_id="taste_profile",      sort_order=15),
+    Tag(id="low_salt",        label="Peu salé",             icon="droplets",     color="cyan",   category_id="taste_profile",      sort_order=16),
+    Tag(id="sweet_savory",    label="Sucré-salé",           icon="candy",        color="pink",   category_id="taste_profile",      sort_order=17),
+)
 
 # Mots-clés de détection CSV  (tag_id → liste de mots-clés, minuscule)
-DIETARY_TAG_KEYWORDS: dict[str, list[str]] = {
+DIETARY_TAG_KEYWORDS: Mapping[str, tuple[str, ...]] = _freeze_keywords({
     "vegetarian":   ["végétarien", "vegetarien", "veggie", "sans viande", "vg", "🌱", "🥬", "🥗", "🥦"],
     "vegan":        ["vegan", "végan", "vgn"],
     "pescetarian":  ["pescetarien", "pescétarien"],
@@ -88,168 +134,168 @@ DIETARY_TAG_KEYWORDS: dict[str, list[str]] = {
     "spicy":        ["épicé", "epice", "épicée", "epicee", "spicy"],
     "low_salt":     ["peu salé", "peu sale", "faible en sel", "low salt"],
     "sweet_savory": ["sucré-salé", "sucre-sale", "sweet savory"],
-}
+})
 
 # ──────────────────────────────────────────────────────────────────────
 #  CATÉGORIES DE CERTIFICATIONS
 # ──────────────────────────────────────────────────────────────────────
 
-CERTIFICATION_CATEGORIES = [
-    {
-        "id": "public_official",
-        "name": "Labels officiels publics",
-        "sort_order": 1,
-    },
-    {
-        "id": "private_certified",
-        "name": "Labels privés certifiés",
-        "sort_order": 2,
-    },
-]
+CERTIFICATION_CATEGORIES: tuple[CertCategory, ...] = (
+    CertCategory(
+        id="public_official",
+        name="Labels officiels publics",
+        sort_order=1,
+    ),
+    CertCategory(
+        id="private_certified",
+        name="Labels privés certifiés",
+        sort_order=2,
+    ),
+)
 
 # ──────────────────────────────────────────────────────────────────────
 #  CERTIFICATIONS  (preuves requises, logos officiels)
 # ──────────────────────────────────────────────────────────────────────
 
-CERTIFICATIONS: list[dict[str, Any]] = [
+CERTIFICATIONS: tuple[Cert, ...] = (
     # ── Labels officiels publics (État / UE) ──
-    {
-        "id": "ab",
-        "name": "AB",
-        "official_name": "Agriculture Biologique",
-        "issuer": "Ministère de l'Agriculture et de la Souveraineté alimentaire",
-        "scheme_type": "public",
-        "jurisdiction": "france",
-        "guarantee": "Production biologique certifiée",
-        "logo_filename": "ab.svg",
-        "category_id": "public_official",
-        "sort_order": 1,
-    },
-    {
-        "id": "eurofeuille",
-        "name": "Eurofeuille",
-        "official_name": "Eurofeuille (Bio UE)",
-        "issuer": "Commission européenne",
-        "scheme_type": "public",
-        "jurisdiction": "eu",
-        "guarantee": "Conformité bio européenne (Règlement UE 2018/848)",
-        "logo_filename": "eurofeuille.svg",
-        "category_id": "public_official",
-        "sort_order": 2,
-    },
-    {
-        "id": "label_rouge",
-        "name": "Label Rouge",
-        "official_name": "Label Rouge",
-        "issuer": "Institut national de l'origine et de la qualité (INAO)",
-        "scheme_type": "public",
-        "jurisdiction": "france",
-        "guarantee": "Qualité supérieure",
-        "logo_filename": "label-rouge.svg",
-        "category_id": "public_official",
-        "sort_order": 3,
-    },
-    {
-        "id": "aop",
-        "name": "AOP",
-        "official_name": "Appellation d'Origine Protégée",
-        "issuer": "Institut national de l'origine et de la qualité (INAO)",
-        "scheme_type": "public",
-        "jurisdiction": "eu",
-        "guarantee": "Origine et savoir-faire local",
-        "logo_filename": "aop.svg",
-        "category_id": "public_official",
-        "sort_order": 4,
-    },
-    {
-        "id": "igp",
-        "name": "IGP",
-        "official_name": "Indication Géographique Protégée",
-        "issuer": "Institut national de l'origine et de la qualité (INAO)",
-        "scheme_type": "public",
-        "jurisdiction": "eu",
-        "guarantee": "Lien géographique partiel",
-        "logo_filename": "igp.svg",
-        "category_id": "public_official",
-        "sort_order": 5,
-    },
-    {
-        "id": "stg",
-        "name": "STG",
-        "official_name": "Spécialité Traditionnelle Garantie",
-        "issuer": "Commission européenne",
-        "scheme_type": "public",
-        "jurisdiction": "eu",
-        "guarantee": "Recette traditionnelle reconnue",
-        "logo_filename": "stg.svg",
-        "category_id": "public_official",
-        "sort_order": 6,
-    },
-    {
-        "id": "hve",
-        "name": "HVE",
-        "official_name": "Haute Valeur Environnementale",
-        "issuer": "Ministère de l'Agriculture et de la Souveraineté alimentaire",
-        "scheme_type": "public",
-        "jurisdiction": "france",
-        "guarantee": "Performance environnementale d'exploitation",
-        "logo_filename": "hve.svg",
-        "category_id": "public_official",
-        "sort_order": 7,
-    },
+    Cert(
+        id="ab",
+        name="AB",
+        official_name="Agriculture Biologique",
+        issuer="Ministère de l'Agriculture et de la Souveraineté alimentaire",
+        scheme_type="public",
+        jurisdiction="france",
+        guarantee="Production biologique certifiée",
+        logo_filename="ab.svg",
+        category_id="public_official",
+        sort_order=1,
+    ),
+    Cert(
+        id="eurofeuille",
+        name="Eurofeuille",
+        official_name="Eurofeuille (Bio UE)",
+        issuer="Commission européenne",
+        scheme_type="public",
+        jurisdiction="eu",
+        guarantee="Conformité bio européenne (Règlement UE 2018/848)",
+        logo_filename="eurofeuille.svg",
+        category_id="public_official",
+        sort_order=2,
+    ),
+    Cert(
+        id="label_rouge",
+        name="Label Rouge",
+        official_name="Label Rouge",
+        issuer="Institut national de l'origine et de la qualité (INAO)",
+        scheme_type="public",
+        jurisdiction="france",
+        guarantee="Qualité supérieure",
+        logo_filename="label-rouge.svg",
+        category_id="public_official",
+        sort_order=3,
+    ),
+    Cert(
+        id="aop",
+        name="AOP",
+        official_name="Appellation d'Origine Protégée",
+        issuer="Institut national de l'origine et de la qualité (INAO)",
+        scheme_type="public",
+        jurisdiction="eu",
+        guarantee="Origine et savoir-faire local",
+        logo_filename="aop.svg",
+        category_id="public_official",
+        sort_order=4,
+    ),
+    Cert(
+        id="igp",
+        name="IGP",
+        official_name="Indication Géographique Protégée",
+        issuer="Institut national de l'origine et de la qualité (INAO)",
+        scheme_type="public",
+        jurisdiction="eu",
+        guarantee="Lien géographique partiel",
+        logo_filename="igp.svg",
+        category_id="public_official",
+        sort_order=5,
+    ),
+    Cert(
+        id="stg",
+        name="STG",
+        official_name="Spécialité Traditionnelle Garantie",
+        issuer="Commission européenne",
+        scheme_type="public",
+        jurisdiction="eu",
+        guarantee="Recette traditionnelle reconnue",
+        logo_filename="stg.svg",
+        category_id="public_official",
+        sort_order=6,
+    ),
+    Cert(
+        id="hve",
+        name="HVE",
+        official_name="Haute Valeur Environnementale",
+        issuer="Ministère de l'Agriculture et de la Souveraineté alimentaire",
+        scheme_type="public",
+        jurisdiction="france",
+        guarantee="Performance environnementale d'exploitation",
+        logo_filename="hve.svg",
+        category_id="public_official",
+        sort_order=7,
+    ),
     # ── Labels privés certifiés ──
-    {
-        "id": "v_label",
-        "name": "V-Label",
-        "official_name": "V-Label",
-        "issuer": "European Vegetarian Union",
-        "scheme_type": "private",
-        "jurisdiction": "international",
-        "guarantee": "Végétarien / vegan certifié",
-        "logo_filename": "v-label.svg",
-        "category_id": "private_certified",
-        "sort_order": 8,
-    },
-    {
-        "id": "bleu_blanc_coeur",
-        "name": "Bleu-Blanc-Cœur",
-        "official_name": "Bleu-Blanc-Cœur",
-        "issuer": "Bleu-Blanc-Cœur",
-        "scheme_type": "private",
-        "jurisdiction": "france",
-        "guarantee": "Qualité nutritionnelle alimentation animale",
-        "logo_filename": "bleu-blanc-coeur.svg",
-        "category_id": "private_certified",
-        "sort_order": 9,
-    },
-    {
-        "id": "fairtrade",
-        "name": "Fairtrade / Max Havelaar",
-        "official_name": "Fairtrade / Max Havelaar",
-        "issuer": "Fairtrade International",
-        "scheme_type": "private",
-        "jurisdiction": "international",
-        "guarantee": "Commerce équitable",
-        "logo_filename": "fairtrade-max-havelaar.svg",
-        "category_id": "private_certified",
-        "sort_order": 10,
-    },
-    {
-        "id": "msc",
-        "name": "MSC",
-        "official_name": "Marine Stewardship Council",
-        "issuer": "Marine Stewardship Council",
-        "scheme_type": "private",
-        "jurisdiction": "international",
-        "guarantee": "Pêche durable certifiée",
-        "logo_filename": "msc.svg",
-        "category_id": "private_certified",
-        "sort_order": 11,
-    },
-]
+    Cert(
+        id="v_label",
+        name="V-Label",
+        official_name="V-Label",
+        issuer="European Vegetarian Union",
+        scheme_type="private",
+        jurisdiction="international",
+        guarantee="Végétarien / vegan certifié",
+        logo_filename="v-label.svg",
+        category_id="private_certified",
+        sort_order=8,
+    ),
+    Cert(
+        id="bleu_blanc_coeur",
+        name="Bleu-Blanc-Cœur",
+        official_name="Bleu-Blanc-Cœur",
+        issuer="Bleu-Blanc-Cœur",
+        scheme_type="private",
+        jurisdiction="france",
+        guarantee="Qualité nutritionnelle alimentation animale",
+        logo_filename="bleu-blanc-coeur.svg",
+        category_id="private_certified",
+        sort_order=9,
+    ),
+    Cert(
+        id="fairtrade",
+        name="Fairtrade / Max Havelaar",
+        official_name="Fairtrade / Max Havelaar",
+        issuer="Fairtrade International",
+        scheme_type="private",
+        jurisdiction="international",
+        guarantee="Commerce équitable",
+        logo_filename="fairtrade-max-havelaar.svg",
+        category_id="private_certified",
+        sort_order=10,
+    ),
+    Cert(
+        id="msc",
+        name="MSC",
+        official_name="Marine Stewardship Council",
+        issuer="Marine Stewardship Council",
+        scheme_type="private",
+        jurisdiction="international",
+        guarantee="Pêche durable certifiée",
+        logo_filename="msc.svg",
+        category_id="private_certified",
+        sort_order=11,
+    ),
+)
 
 # Mots-clés de détection CSV  (certification_id → liste de mots-clés)
-CERTIFICATION_KEYWORDS: dict[str, list[str]] = {
+CERTIFICATION_KEYWORDS: Mapping[str, tuple[str, ...]] = _freeze_keywords({
     "ab":                ["ab", "agriculture biologique", "bio", "biologique", "organic", "🌿"],
     "eurofeuille":       ["eurofeuille", "bio ue", "biologique ue", "eu organic"],
     "label_rouge":       ["label rouge"],
@@ -261,14 +307,14 @@ CERTIFICATION_KEYWORDS: dict[str, list[str]] = {
     "bleu_blanc_coeur":  ["bleu blanc coeur", "bleu-blanc-coeur", "bleu-blanc-cœur"],
     "fairtrade":         ["fairtrade", "max havelaar", "commerce équitable", "commerce equitable"],
     "msc":               ["msc", "marine stewardship", "pêche durable", "peche durable", "🐟"],
-}
+})
 
 
 # ──────────────────────────────────────────────────────────────────────
 #  TAGS & CERTIFICATIONS ACTIVÉS PAR DÉFAUT
 # ──────────────────────────────────────────────────────────────────────
 
-DEFAULT_ENABLED_TAG_IDS: set[str] = {
+DEFAULT_ENABLED_TAG_IDS: frozenset[str] = frozenset({
     "vegetarian",     # Végétarien
     "pork_free",      # Sans porc
     "gluten_free",    # Sans gluten
@@ -276,37 +322,51 @@ DEFAULT_ENABLED_TAG_IDS: set[str] = {
     "chef_special",   # Plat du chef
     "local_product",  # Produit local
     "seasonal",       # Produit de saison
-}
+})
 
-DEFAULT_ENABLED_CERT_IDS: set[str] = {
+DEFAULT_ENABLED_CERT_IDS: frozenset[str] = frozenset({
     "ab",                 # Agriculture Biologique
     "eurofeuille",        # Bio UE
     "label_rouge",        # Label Rouge
     "hve",                # Haute Valeur Environnementale
     "v_label",            # V-Label
     "bleu_blanc_coeur",   # Bleu-Blanc-Cœur
-}
+})
 
 
 # ──────────────────────────────────────────────────────────────────────
 #  HELPERS (utilisés côté serveur)
 # ──────────────────────────────────────────────────────────────────────
 
-def get_tag_by_id(tag_id: str) -> dict | None:
+# Index construits une fois à l'import : les tables ne changent pas à l'exécution.
+_TAGS_BY_ID: dict[str, Tag] = {t.id: t for t in DIETARY_TAGS}
+_CERTS_BY_ID: dict[str, Cert] = {c.id: c for c in CERTIFICATIONS}
+_ALL_TAG_IDS: frozenset[str] = frozenset(_TAGS_BY_ID)
+_ALL_CERT_IDS: frozenset[str] = frozenset(_CERTS_BY_ID)
+
+# Un identifiant par défaut inconnu doit faire échouer l'import, pas le seed.
+# (raise plutôt qu'assert : la vérification doit survivre à `python -O`.)
+if _unknown := DEFAULT_ENABLED_TAG_IDS - _ALL_TAG_IDS:
+    raise ValueError(f"Tags par défaut inconnus : {sorted(_unknown)}")
+if _unknown := DEFAULT_ENABLED_CERT_IDS - _ALL_CERT_IDS:
+    raise ValueError(f"Certifications par défaut inconnues : {sorted(_unknown)}")
+
+
+def get_tag_by_id(tag_id: str) -> Tag | None:
     """Retourne un tag par son identifiant."""
-    return next((t for t in DIETARY_TAGS if t["id"] == tag_id), None)
+    return _TAGS_BY_ID.get(tag_id)
 
 
-def get_certification_by_id(cert_id: str) -> dict | None:
+def get_certification_by_id(cert_id: str) -> Cert | None:
     """Retourne une certification par son identifiant."""
-    return next((c for c in CERTIFICATIONS if c["id"] == cert_id), None)
+    return _CERTS_BY_ID.get(cert_id)
 
 
-def get_all_tag_ids() -> set[str]:
-    """Retourne l'ensemble de tous les identifiants de tags."""
-    return {t["id"] for t in DIETARY_TAGS}
+def get_all_tag_ids() -> frozenset[str]:
+    """Retourne l'ensemble (immuable) de tous les identifiants de tags."""
+    return _ALL_TAG_IDS
 
 
-def get_all_certification_ids() -> set[str]:
-    """Retourne l'ensemble de tous les identifiants de certifications."""
-    return {c["id"] for c in CERTIFICATIONS}
+def get_all_certification_ids() -> frozenset[str]:
+    """Retourne l'ensemble (immuable) de tous les identifiants de certifications."""
+    return _ALL_CERT_IDS
@@ -1,10 +1,55 @@
 """
 Extensions Flask - Instances globales initialisées dans create_app().
 """
+import threading
+import time
+from collections import OrderedDict
+
 from flask_jwt_extended import JWTManager
+from flask_jwt_extended.config import config as jwt_config
 from flask_migrate import Migrate
 from flask_sqlalchemy import SQLAlchemy
 
+
+class CachingJWTManager(JWTManager):
+    """JWTManager qui mémorise les claims des tokens déjà vérifiés.
+
+    Un même access token est présenté à chaque appel d'API ; on évite de
+    refaire le décodage base64 + la vérification HMAC tant qu'il n'a pas
+    expiré. La blocklist (révocation, tokens_valid_after) reste vérifiée à
+    chaque requête par le token_in_blocklist_loader.
+    """
+
+    def __init__(self, app=None, add_context_processor=False, maxsize=4096):
+        super().__init__(app, add_context_processor)
+        self._verified: OrderedDict[tuple, dict] = OrderedDict()
+        self._verified_lock = threading.Lock()
+        self._maxsize = maxsize
+
+    def _decode_jwt_from_config(self, encoded_token, csrf_value=None, allow_expired=False):
+        # Cookie tokens (CSRF) and allow_expired decodes always take the full path.
+        if csrf_value is not None or allow_expired:
+            return super()._decode_jwt_from_config(encoded_token, csrf_value, allow_expired)
+
+        # Keyed on the verification key too: a token is only trusted for the
+        # secret it was checked against.
+        key = (jwt_config.decode_key, encoded_token)
+        with self._verified_lock:
+            claims = self._verified.get(key)
+            if claims is not None:
+                if claims.get('exp', float('inf')) > time.time():
+                    self._verified.move_to_end(key)
+                    return dict(claims)
+                del self._verified[key]
+
+        claims = super()._decode_jwt_from_config(encoded_token)
+        with self._verified_lock:
+            self._verified[key] = claims
+            if len(self._verified) > self._maxsize:
+                self._verified.popitem(last=False)
+        return dict(claims)
+
+
 db = SQLAlchemy()
-jwt = JWTManager()
+jwt = CachingJWTManager()
 migrate = Migrate()
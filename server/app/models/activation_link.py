@@ -7,15 +7,22 @@ Utilisé pour :
 - Réinitialiser les accès en cas de problème
 """
 import secrets
-from datetime import datetime, timedelta
+from datetime import timedelta
 
 from ..extensions import db
+from ..utils.time import utcnow
 
 
 class ActivationLink(db.Model):
     """Lien d'activation à usage unique et durée limitée."""
     
     __tablename__ = 'activation_links'
+
+    __table_args__ = (
+        # Invitations d'un restaurant, les plus récentes d'abord
+        db.Index('ix_activation_links_restaurant_id_link_type_created_at',
+                 'restaurant_id', 'link_type', 'created_at'),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     token = db.Column(db.String(128), unique=True, nullable=False, index=True)
@@ -24,7 +31,7 @@ class ActivationLink(db.Model):
     role = db.Column(db.String(20), default='editor')  # Rôle attribué à l'activation
     expires_at = db.Column(db.DateTime, nullable=False)
     used_at = db.Column(db.DateTime, nullable=True)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    created_at = db.Column(db.DateTime, default=utcnow)
     created_by_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=True)
 
     restaurant_id = db.Column(db.Integer, db.ForeignKey('restaurants.id'), nullable=True)
@@ -34,7 +41,7 @@ class ActivationLink(db.Model):
     created_by = db.relationship('User', backref='created_activation_links', foreign_keys=[created_by_id])
     
     # Types de lien valides
-    VALID_TYPES = ['first_admin', 'invite', 'password_reset']
+    VALID_TYPES = frozenset({'first_admin', 'invite', 'password_reset'})
     
     @classmethod
     def generate_token(cls):
@@ -48,7 +55,7 @@ class ActivationLink(db.Model):
             token=cls.generate_token(),
             link_type='first_admin',
             role='admin',
-            expires_at=datetime.utcnow() + timedelta(hours=expires_hours)
+            expires_at=utcnow() + timedelta(hours=expires_hours)
         )
     
     @classmethod
@@ -60,7 +67,7 @@ class ActivationLink(db.Model):
             email=email,
             link_type='invite',
             role=role,
-            expires_at=datetime.utcnow() + timedelta(hours=expires_hours),
+            expires_at=utcnow() + timedelta(hours=expires_hours),
             created_by_id=created_by_id,
             restaurant_id=restaurant_id,
             organization_id=organization_id,
@@ -86,19 +93,22 @@ class ActivationLink(db.Model):
             email=email,
             link_type='password_reset',
             role=None,  # Pas de changement de rôle
-            expires_at=datetime.utcnow() + timedelta(hours=expires_hours),
+            expires_at=utcnow() + timedelta(hours=expires_hours),
             created_by_id=created_by_id
         )
     
-    def is_valid(self):
-        """Vérifie si le lien est encore valide (non expiré et non utilisé)."""
-        return self.used_at is None and datetime.utcnow() < self.expires_at
+    def is_valid(self, now=None):
+        """Vérifie si le lien est encore valide (non expiré et non utilisé).
+
+        `now` permet de partager une seule lecture de l'horloge entre plusieurs liens.
+        """
+        return self.used_at is None and (now or utcnow()) < self.expires_at
     
     def mark_as_used(self):
         """Marque le lien comme utilisé."""
-        self.used_at = datetime.utcnow()
+        self.used_at = utcnow()
     
-    def to_dict(self, include_token=False):
+    def to_dict(self, include_token=False, now=None):
         """Sérialise le lien en dictionnaire JSON."""
         data = {
             'id': self.id,
@@ -107,7 +117,7 @@ class ActivationLink(db.Model):
             'role': self.role,
             'expires_at': self.expires_at.isoformat() if self.expires_at else None,
             'is_used': self.used_at is not None,
-            'is_valid': self.is_valid(),
+            'is_valid': self.is_valid(now),
             'created_at': self.created_at.isoformat() if self.created_at else None
         }
         if include_token:
@@ -8,15 +8,23 @@ Enregistre les actions critiques pour la sécurité et la traçabilité :
 - Modifications de configuration
 """
 import json
-from datetime import UTC, datetime
+from datetime import UTC
 
 from ..extensions import db
+from ..utils.time import utcnow
 
 
 class AuditLog(db.Model):
     """Journal d'audit des actions sensibles."""
     
     __tablename__ = 'audit_logs'
+    __table_args__ = (
+        # Listes filtrées par utilisateur ou par action, triées par date
+        db.Index('ix_audit_logs_user_id_created_at', 'user_id', 'created_at'),
+        db.Index('ix_audit_logs_action_created_at', 'action', 'created_at'),
+        # Liste complète triée par (created_at, id) : pagination par curseur
+        db.Index('ix_audit_logs_created_at_id', 'created_at', 'id'),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=True)
@@ -29,7 +37,7 @@ class AuditLog(db.Model):
     details = db.Column(db.Text, nullable=True)  # JSON
     ip_address = db.Column(db.String(45), nullable=True)  # IPv4 ou IPv6
     user_agent = db.Column(db.String(500), nullable=True)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow, index=True)
+    created_at = db.Column(db.DateTime, default=utcnow)
     
     # Relation
     user = db.relationship('User', backref='audit_logs', foreign_keys=[user_id])
@@ -77,14 +85,26 @@ class AuditLog(db.Model):
     @classmethod
     def log(cls, action, user_id=None, target_type=None, target_id=None,
             details=None, ip_address=None, user_agent=None, restaurant_id=None):
-        """Crée une nouvelle entrée de journal."""
+        """Crée une nouvelle entrée de journal.
+
+        `details` peut être un objet sérialisable ou une chaîne JSON déjà
+        encodée (str/bytes), stockée telle quelle. Un dict vide est conservé.
+        """
+        if details is None:
+            serialized = None
+        elif isinstance(details, (bytes, bytearray)):
+            serialized = details.decode()
+        elif isinstance(details, str):
+            serialized = details
+        else:
+            serialized = json.dumps(details, separators=(',', ':'), ensure_ascii=False)
         log_entry = cls(
             user_id=user_id,
             restaurant_id=restaurant_id,
             action=action,
             target_type=target_type,
             target_id=target_id,
-            details=json.dumps(details) if details else None,
+            details=serialized,
             ip_address=ip_address,
             user_agent=user_agent
         )
@@ -93,13 +113,17 @@ class AuditLog(db.Model):
         return log_entry
     
     def get_details(self):
-        """Parse les détails JSON."""
-        if self.details:
-            try:
-                return json.loads(self.details)
-            except json.JSONDecodeError:
-                return None
-        return None
+        """Parse les détails JSON (une seule fois par valeur de `details`)."""
+        cached = self.__dict__.get('_details_cache')
+        if cached is None or cached[0] is not self.details:
+            parsed = None
+            if self.details:
+                try:
+                    parsed = json.loads(self.details)
+                except json.JSONDecodeError:
+                    pass
+            cached = self._details_cache = (self.details, parsed)
+        return cached[1]
     
     def to_dict(self):
         """Sérialise l'entrée de journal en dictionnaire JSON."""
@@ -83,17 +83,18 @@ class DishCatalog(db.Model):
         onupdate=lambda: datetime.now(UTC),
     )
 
-    # Relations taxonomie
+    # Relations taxonomie — chargées par lot (selectin) : un menu ou une liste
+    # du catalogue sérialise tous ses plats, sans une requête par plat.
     tags = db.relationship(
         'DietaryTag',
         secondary=dish_dietary_tags,
-        lazy='select',
+        lazy='selectin',
         order_by='DietaryTag.sort_order',
     )
     certifications = db.relationship(
         'Certification',
         secondary=dish_certifications,
-        lazy='select',
+        lazy='selectin',
         order_by='Certification.sort_order',
     )
 
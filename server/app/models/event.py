@@ -18,6 +18,10 @@ class Event(db.Model):
     """Événement à afficher sur les écrans TV et mobile."""
 
     __tablename__ = 'events'
+    __table_args__ = (
+        # Événements à venir d'un restaurant (listes publiques et éditeur)
+        db.Index('ix_events_restaurant_id_event_date_status', 'restaurant_id', 'event_date', 'status'),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     restaurant_id = db.Column(db.Integer, db.ForeignKey('restaurants.id'), nullable=False)
@@ -46,13 +50,13 @@ class Event(db.Model):
     # Relations
     created_by = db.relationship('User', backref='created_events', foreign_keys=[created_by_id])
     images = db.relationship(
-        'EventImage', backref='event', lazy='dynamic',
+        'EventImage', backref='event', lazy='selectin',
         cascade='all, delete-orphan', order_by='EventImage.order',
     )
 
     # Constantes
-    VALID_VISIBILITY = ['tv', 'mobile', 'all']
-    VALID_STATUS = ['draft', 'published']
+    VALID_VISIBILITY = frozenset({'tv', 'mobile', 'all'})
+    VALID_STATUS = frozenset({'draft', 'published'})
 
     def to_dict(self, include_images=True):
         """Sérialise l'événement en dictionnaire JSON."""
@@ -71,7 +75,7 @@ class Event(db.Model):
             'updated_at': self.updated_at.isoformat() if self.updated_at else None,
         }
         if include_images:
-            data['images'] = [img.to_dict() for img in self.images.order_by(EventImage.order)]
+            data['images'] = [img.to_dict() for img in self.images]
         return data
 
     def __repr__(self):
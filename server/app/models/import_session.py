@@ -3,10 +3,10 @@ MARIAM - Modèle ImportSession
 
 Stocke temporairement les fichiers CSV parsés en base de données.
 """
-import json
-from datetime import datetime, timedelta
+from datetime import timedelta
 
 from ..extensions import db
+from ..utils.time import utcnow
 
 
 class ImportSession(db.Model):
@@ -17,41 +17,51 @@ class ImportSession(db.Model):
     id = db.Column(db.String(36), primary_key=True)  # UUID
     user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
     filename = db.Column(db.String(255), nullable=False)
-    columns = db.Column(db.Text, nullable=False)  # JSON array
-    rows = db.Column(db.Text, nullable=False)     # JSON array
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    # JSON (et non JSONB) : l'ordre des clés de chaque ligne suit celui du CSV.
+    columns = db.Column(db.JSON, nullable=False)
+    rows = db.Column(db.JSON, nullable=False)
+    created_at = db.Column(db.DateTime, default=utcnow)
     expires_at = db.Column(db.DateTime, nullable=False)
+
+    __table_args__ = (
+        db.Index('ix_import_session_expires_at', 'expires_at'),
+    )
     
     def __init__(self, id, user_id, filename, columns, rows, expires_minutes=30):
         self.id = id
         self.user_id = user_id
         self.filename = filename
-        self.columns = json.dumps(columns)
-        self.rows = json.dumps(rows)
-        self.expires_at = datetime.utcnow() + timedelta(minutes=expires_minutes)
+        self.columns = columns
+        self.rows = rows
+        self.expires_at = utcnow() + timedelta(minutes=expires_minutes)
     
     def get_columns(self) -> list:
         """Retourne les colonnes comme liste Python."""
-        return json.loads(self.columns)
+        return self.columns
     
     def get_rows(self) -> list:
         """Retourne les lignes comme liste de dictionnaires."""
-        return json.loads(self.rows)
+        return self.rows
     
     def is_expired(self) -> bool:
         """Vérifie si la session a expiré."""
-        return datetime.utcnow() > self.expires_at
+        return utcnow() > self.expires_at
     
     @classmethod
     def cleanup_expired(cls):
-        """Supprime les sessions expirées."""
-        cls.query.filter(cls.expires_at < datetime.utcnow()).delete()
+        """Supprime les sessions expirées (un seul DELETE côté serveur)."""
+        cls.query.filter(cls.expires_at < utcnow()).delete(synchronize_session=False)
         db.session.commit()
     
     @classmethod
     def get_valid(cls, session_id: str, user_id: int):
-        """Récupère une session valide pour un utilisateur."""
-        session = cls.query.filter_by(id=session_id, user_id=user_id).first()
-        if session and not session.is_expired():
-            return session
-        return None
+        """Récupère une session valide pour un utilisateur.
+
+        L'expiration est filtrée en SQL : une session expirée ne fait pas
+        transférer ses lignes CSV pour rien.
+        """
+        return cls.query.filter(
+            cls.id == session_id,
+            cls.user_id == user_id,
+            cls.expires_at >= utcnow(),
+        ).first()
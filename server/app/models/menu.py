@@ -30,10 +30,11 @@ class Menu(db.Model):
     # Note du chef — courte phrase / citation affichée en TV
     chef_note = db.Column(db.String(300), nullable=True)
     
-    # Relations
-    items = db.relationship('MenuItem', backref='menu', lazy='dynamic',
+    # Relations — chargées par lot (selectin) : lister une semaine de menus
+    # ne coûte qu'une requête par collection, quel que soit le nombre de menus.
+    items = db.relationship('MenuItem', backref='menu', lazy='selectin',
                            cascade='all, delete-orphan', order_by='MenuItem.order')
-    images = db.relationship('MenuImage', backref='menu', lazy='dynamic',
+    images = db.relationship('MenuImage', backref='menu', lazy='selectin',
                             cascade='all, delete-orphan', order_by='MenuImage.order')
     substitutions = db.relationship(
         'CategorySubstitution',
@@ -60,7 +61,8 @@ class Menu(db.Model):
         }
         
         if include_items:
-            data['items'] = [item.to_dict() for item in self.items.order_by(MenuItem.category_id, MenuItem.order)]
+            items = sorted(self.items, key=lambda i: (i.category_id, i.order or 0))
+            data['items'] = [item.to_dict() for item in items]
             # Substitutions groupées par category_id
             subs: dict[str, list] = {}
             for s in self.substitutions:
@@ -71,7 +73,7 @@ class Menu(db.Model):
             data['substitutions'] = subs
 
         if include_images:
-            data['images'] = [img.to_dict() for img in self.images.order_by(MenuImage.order)]
+            data['images'] = [img.to_dict() for img in self.images]
 
         return data
     
@@ -107,6 +109,8 @@ class MenuItem(db.Model):
 
     __table_args__ = (
         db.Index('ix_menu_items_menu_id_dish_id', 'menu_id', 'dish_id'),
+        # Comptages d'usage par plat (catalogue) et contrôle RESTRICT à la suppression
+        db.Index('ix_menu_items_dish_id', 'dish_id'),
     )
 
     dish = db.relationship('DishCatalog', lazy='joined')
@@ -140,6 +144,10 @@ class MenuImage(db.Model):
     order = db.Column(db.Integer, default=0)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
 
+    __table_args__ = (
+        db.Index('ix_menu_images_menu_id_order', 'menu_id', 'order'),
+    )
+
     def to_dict(self):
         return {
             'id': self.id,
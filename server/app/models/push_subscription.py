@@ -55,15 +55,26 @@ class PushSubscription(db.Model):
     # Relations
     restaurant = db.relationship('Restaurant', backref=db.backref('push_subscriptions', lazy='dynamic'))
 
+    # Index partiels pour le planificateur (chaque minute : heure = HH:MM)
+    # et l'envoi des événements — seuls les abonnés concernés y figurent.
+    __table_args__ = (
+        db.Index('ix_push_subscriptions_today_menu_time', 'notify_today_menu_time',
+                 postgresql_where=notify_today_menu),
+        db.Index('ix_push_subscriptions_tomorrow_menu_time', 'notify_tomorrow_menu_time',
+                 postgresql_where=notify_tomorrow_menu),
+        db.Index('ix_push_subscriptions_events_restaurant_id', 'restaurant_id',
+                 postgresql_where=notify_events),
+    )
+
     def to_dict(self):
         """Sérialise la souscription en dictionnaire JSON (sans données sensibles)."""
         return {
             'id': self.id,
             'restaurant_id': self.restaurant_id,
             'notify_today_menu': self.notify_today_menu,
-            'notify_today_menu_time': self.notify_today_menu_time.strftime('%H:%M') if self.notify_today_menu_time else '11:00',
+            'notify_today_menu_time': self.notify_today_menu_time.isoformat('minutes') if self.notify_today_menu_time else '11:00',
             'notify_tomorrow_menu': self.notify_tomorrow_menu,
-            'notify_tomorrow_menu_time': self.notify_tomorrow_menu_time.strftime('%H:%M') if self.notify_tomorrow_menu_time else '19:00',
+            'notify_tomorrow_menu_time': self.notify_tomorrow_menu_time.isoformat('minutes') if self.notify_tomorrow_menu_time else '19:00',
             'notify_events': self.notify_events,
             'platform': self.platform,
             'created_at': self.created_at.isoformat() if self.created_at else None,
@@ -9,9 +9,13 @@ Pensé dès le départ pour le multi-RU :
 """
 from datetime import datetime
 
+from sqlalchemy import event as sa_event
+
 from ..data.taxonomy import DEFAULT_ENABLED_CERT_IDS, DEFAULT_ENABLED_TAG_IDS
 from ..extensions import db
+from ..utils.cache import ttl_cache
 from .taxonomy import (
+    TAXONOMY_CACHE_TTL,
     Certification,
     DietaryTag,
     restaurant_certifications,
@@ -22,6 +26,29 @@ from .taxonomy import (
 DEFAULT_SERVICE_DAYS = [0, 1, 2, 3, 4]
 
 
+@ttl_cache(TAXONOMY_CACHE_TTL)
+def default_taxonomy_dicts() -> tuple[list[dict], list[dict]]:
+    """Tags et certifications activés par défaut, sérialisés (mis en cache).
+
+    La taxonomie n'est écrite que par les migrations et `flask seed` ; le cache
+    est vidé à chaque écriture ORM sur DietaryTag / Certification.
+    """
+    return (
+        DietaryTag.dicts_for_ids(DEFAULT_ENABLED_TAG_IDS),
+        Certification.dicts_for_ids(DEFAULT_ENABLED_CERT_IDS),
+    )
+
+
+@sa_event.listens_for(DietaryTag, 'after_insert')
+@sa_event.listens_for(DietaryTag, 'after_update')
+@sa_event.listens_for(DietaryTag, 'after_delete')
+@sa_event.listens_for(Certification, 'after_insert')
+@sa_event.listens_for(Certification, 'after_update')
+@sa_event.listens_for(Certification, 'after_delete')
+def _clear_default_taxonomy(*_args):
+    default_taxonomy_dicts.cache_clear()
+
+
 class Restaurant(db.Model):
     """Entité Restaurant universitaire."""
     
@@ -118,23 +145,21 @@ class Restaurant(db.Model):
         on renvoie les défauts définis dans taxonomy.py
         """
         if self.tags_customized:
-            tags = list(self.enabled_tags)
-            certs = list(self.enabled_certifications)
+            tags = [t.to_dict() for t in self.enabled_tags]
+            certs = [c.to_dict() for c in self.enabled_certifications]
         else:
-            tags = DietaryTag.query.filter(
-                DietaryTag.id.in_(DEFAULT_ENABLED_TAG_IDS)
-            ).order_by(DietaryTag.sort_order).all()
-            certs = Certification.query.filter(
-                Certification.id.in_(DEFAULT_ENABLED_CERT_IDS)
-            ).order_by(Certification.sort_order).all()
+            default_tags, default_certs = default_taxonomy_dicts()
+            # Copies : l'appelant peut modifier le dict renvoyé
+            tags = [dict(t) for t in default_tags]
+            certs = [dict(c) for c in default_certs]
 
         categories = self.get_menu_categories_list()
         return {
             'service_days': self.get_service_days(),
             'service_hours': self.get_service_hours_dict(),
             'menu_categories': [c.to_dict() for c in categories],
-            'dietary_tags': [t.to_dict() for t in tags],
-            'certifications': [c.to_dict() for c in certs],
+            'dietary_tags': tags,
+            'certifications': certs,
         }
     
     def get_service_hours_dict(self):
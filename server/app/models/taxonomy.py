@@ -4,7 +4,17 @@ Modèles de taxonomie — Tags alimentaires & Certifications.
 Tables de référence peuplées depuis server/app/data/taxonomy.py.
 Tables de jonction pour les relations N:N avec restaurants et menu_items.
 """
+from flask import current_app
+from sqlalchemy import event as sa_event
+from sqlalchemy.orm import raiseload, selectinload
+
 from ..extensions import db
+from ..utils.cache import ttl_cache
+
+# Durée de vie des caches de taxonomie (s). Les écritures ORM du processus les
+# vident ; le TTL couvre `flask seed` lancé dans un autre processus.
+TAXONOMY_CACHE_TTL = 300
+
 
 # ──────────────────────────────────────────────────────────────────────
 #  TABLES DE JONCTION  (N:N)
@@ -23,6 +33,17 @@ restaurant_certifications = db.Table(
 )
 
 
+def _select_dicts(model, keys, ids):
+    """Lignes de `model` (ids donnés, triées par sort_order) en dicts `keys`,
+    lues par un SELECT de colonnes, sans instancier de modèles."""
+    stmt = (
+        db.select(*(getattr(model, k) for k in keys))
+        .where(model.id.in_(ids))
+        .order_by(model.sort_order)
+    )
+    return [dict(row) for row in db.session.execute(stmt).mappings()]
+
+
 # ──────────────────────────────────────────────────────────────────────
 #  CATÉGORIES
 # ──────────────────────────────────────────────────────────────────────
@@ -37,7 +58,7 @@ class DietaryTagCategory(db.Model):
     color = db.Column(db.String(30), nullable=True)
     sort_order = db.Column(db.Integer, default=0)
 
-    tags = db.relationship('DietaryTag', backref='category', lazy='select',
+    tags = db.relationship('DietaryTag', backref='category', lazy='selectin',
                            order_by='DietaryTag.sort_order')
 
     def to_dict(self):
@@ -59,7 +80,7 @@ class CertificationCategory(db.Model):
     name = db.Column(db.String(100), nullable=False)
     sort_order = db.Column(db.Integer, default=0)
 
-    certifications = db.relationship('Certification', backref='category', lazy='select',
+    certifications = db.relationship('Certification', backref='category', lazy='selectin',
                                      order_by='Certification.sort_order')
 
     def to_dict(self):
@@ -90,6 +111,14 @@ class DietaryTag(db.Model):
     keywords = db.relationship('DietaryTagKeyword', backref='tag', lazy='select',
                                cascade='all, delete-orphan')
 
+    # Clés de to_dict(), dans le même ordre
+    DICT_KEYS = ('id', 'label', 'icon', 'color', 'category_id', 'sort_order')
+
+    @classmethod
+    def dicts_for_ids(cls, ids):
+        """Équivalent de [t.to_dict() for t in tags], sans charger d'objets ORM."""
+        return _select_dicts(cls, cls.DICT_KEYS, ids)
+
     def to_dict(self):
         return {
             'id': self.id,
@@ -138,6 +167,17 @@ class Certification(db.Model):
     keywords = db.relationship('CertificationKeyword', backref='certification', lazy='select',
                                cascade='all, delete-orphan')
 
+    # Clés de to_dict(), dans le même ordre
+    DICT_KEYS = (
+        'id', 'name', 'official_name', 'issuer', 'scheme_type', 'jurisdiction',
+        'guarantee', 'logo_filename', 'category_id', 'sort_order',
+    )
+
+    @classmethod
+    def dicts_for_ids(cls, ids):
+        """Équivalent de [c.to_dict() for c in certifications], sans charger d'objets ORM."""
+        return _select_dicts(cls, cls.DICT_KEYS, ids)
+
     def to_dict(self):
         return {
             'id': self.id,
@@ -165,3 +205,43 @@ class CertificationKeyword(db.Model):
     __table_args__ = (
         db.UniqueConstraint('certification_id', 'keyword', name='uq_cert_keyword'),
     )
+
+
+# ──────────────────────────────────────────────────────────────────────
+#  CATALOGUE SÉRIALISÉ (cache)
+# ──────────────────────────────────────────────────────────────────────
+
+@ttl_cache(TAXONOMY_CACHE_TTL)
+def taxonomy_catalog_json() -> str:
+    """Catalogue complet (catégories avec leurs tags / certifications), en JSON.
+
+    Mis en cache déjà sérialisé : la taxonomie ne change qu'au `flask seed`.
+    """
+    # Une requête IN par relation ; tout autre chargement paresseux lève.
+    # (mypy type ici les relations comme RelationshipProperty, pas comme attributs)
+    tag_categories = DietaryTagCategory.query.options(
+        selectinload(DietaryTagCategory.tags), raiseload('*'),  # type: ignore[arg-type]
+    ).order_by(DietaryTagCategory.sort_order).all()
+    cert_categories = CertificationCategory.query.options(
+        selectinload(CertificationCategory.certifications), raiseload('*'),  # type: ignore[arg-type]
+    ).order_by(CertificationCategory.sort_order).all()
+    return current_app.json.dumps({
+        'dietary_tag_categories': [c.to_dict() for c in tag_categories],
+        'certification_categories': [c.to_dict() for c in cert_categories],
+    })
+
+
+@sa_event.listens_for(DietaryTagCategory, 'after_insert')
+@sa_event.listens_for(DietaryTagCategory, 'after_update')
+@sa_event.listens_for(DietaryTagCategory, 'after_delete')
+@sa_event.listens_for(DietaryTag, 'after_insert')
+@sa_event.listens_for(DietaryTag, 'after_update')
+@sa_event.listens_for(DietaryTag, 'after_delete')
+@sa_event.listens_for(CertificationCategory, 'after_insert')
+@sa_event.listens_for(CertificationCategory, 'after_update')
+@sa_event.listens_for(CertificationCategory, 'after_delete')
+@sa_event.listens_for(Certification, 'after_insert')
+@sa_event.listens_for(Certification, 'after_update')
+@sa_event.listens_for(Certification, 'after_delete')
+def _clear_taxonomy_catalog(*_args):
+    taxonomy_catalog_json.cache_clear()
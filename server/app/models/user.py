@@ -7,19 +7,49 @@ Différences par rapport à un modèle User classique :
 - Association possible à un restaurant (multi-RU ready)
 - Validation de mot de passe fort
 """
+import os
 import re
 from datetime import UTC, datetime
+from functools import lru_cache
 
 from werkzeug.security import check_password_hash, generate_password_hash
 
 from ..extensions import db
 from ..services.crypto import EncryptedSecret
 
+# Méthode de hachage des mots de passe, explicite plutôt que le défaut de
+# Werkzeug (qui peut changer à une montée de version). scrypt N=2^15, r=8 :
+# ~32 Mo de mémoire par hachage, ~0.1 s ; à recalibrer selon le serveur.
+PASSWORD_HASH_METHOD = os.environ.get('PASSWORD_HASH_METHOD', 'scrypt:32768:8:1')
+
+
+@lru_cache(maxsize=4)
+def _hash_method_prefix(method):
+    """Préfixe `méthode:paramètres` que Werkzeug écrit réellement pour `method`.
+
+    Werkzeug développe les formes courtes ('scrypt' -> 'scrypt:32768:8:1',
+    'pbkdf2' -> 'pbkdf2:sha256:600000') : on compare au hash produit, pas au
+    réglage tel qu'écrit dans l'environnement.
+    """
+    return generate_password_hash('', method=method).split('$', 1)[0]
+
+
+# Critères de force des mots de passe (compilés une fois)
+_RE_UPPER = re.compile(r'[A-Z]')
+_RE_LOWER = re.compile(r'[a-z]')
+_RE_DIGIT = re.compile(r'\d')
+_RE_SPECIAL = re.compile(r'[!@#$%^&*(),.?":{}|<>_\-+=\[\]\\;\'`~]')
+
 
 class User(db.Model):
     """Utilisateur de MARIAM avec authentification sécurisée."""
     
     __tablename__ = 'users'
+
+    __table_args__ = (
+        # Liste des utilisateurs d'un restaurant, triée par date de création
+        db.Index('ix_users_restaurant_id_created_at', 'restaurant_id', 'created_at'),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     email = db.Column(db.String(120), unique=True, nullable=False, index=True)
@@ -61,7 +91,7 @@ class User(db.Model):
     ROLE_ADMIN = 'admin'          # Admin of a single restaurant (site)
     ROLE_EDITOR = 'editor'
     ROLE_READER = 'reader'
-    VALID_ROLES = [ROLE_ORG_ADMIN, ROLE_ADMIN, ROLE_EDITOR, ROLE_READER]
+    VALID_ROLES = (ROLE_ORG_ADMIN, ROLE_ADMIN, ROLE_EDITOR, ROLE_READER)
     
     def set_password(self, password):
         """
@@ -73,11 +103,21 @@ class User(db.Model):
                 "Le mot de passe doit contenir au moins 12 caractères, "
                 "une majuscule, une minuscule, un chiffre et un caractère spécial."
             )
-        self.password_hash = generate_password_hash(password)
+        self.password_hash = generate_password_hash(password, method=PASSWORD_HASH_METHOD)
     
     def check_password(self, password):
         """Vérifie si le mot de passe correspond au hash stocké."""
         return check_password_hash(self.password_hash, password)
+
+    def password_needs_rehash(self):
+        """Le hash stocké a-t-il été produit avec une autre méthode/d'autres paramètres ?"""
+        stored = (self.password_hash or '').split('$', 1)[0]
+        return stored != _hash_method_prefix(PASSWORD_HASH_METHOD)
+
+    def rehash_password(self, password):
+        """Re-hache un mot de passe déjà vérifié avec la méthode courante
+        (sans revalider sa force : il a pu être choisi sous une règle antérieure)."""
+        self.password_hash = generate_password_hash(password, method=PASSWORD_HASH_METHOD)
     
     @staticmethod
     def validate_password_strength(password):
@@ -92,15 +132,12 @@ class User(db.Model):
         """
         if len(password) < 12:
             return False
-        if not re.search(r'[A-Z]', password):
-            return False
-        if not re.search(r'[a-z]', password):
-            return False
-        if not re.search(r'\d', password):
-            return False
-        if not re.search(r'[!@#$%^&*(),.?":{}|<>_\-+=\[\]\\;\'`~]', password):
-            return False
-        return True
+        return bool(
+            _RE_UPPER.search(password)
+            and _RE_LOWER.search(password)
+            and _RE_DIGIT.search(password)
+            and _RE_SPECIAL.search(password)
+        )
     
     def set_mfa_secret(self, secret):
         """Stocke le secret TOTP pour MFA."""
@@ -150,10 +187,11 @@ class User(db.Model):
         """Met à jour la date de dernière connexion."""
         self.last_login = datetime.utcnow()
     
-    def to_dict(self, include_sensitive=False):
+    def to_dict(self, include_sensitive=False, passkeys_count=None):
         """
         Sérialise l'utilisateur en dictionnaire JSON.
         N'inclut jamais le password_hash ni le mfa_secret.
+        `passkeys_count` : valeur déjà calculée par l'appelant (listes), sinon COUNT.
         """
         data = {
             'id': self.id,
@@ -166,7 +204,7 @@ class User(db.Model):
             'organization_id': self.organization_id,
             'created_at': self.created_at.isoformat() if self.created_at else None,
             'last_login': self.last_login.isoformat() if self.last_login else None,
-            'passkeys_count': self.passkeys.count(),
+            'passkeys_count': self.passkeys.count() if passkeys_count is None else passkeys_count,
         }
         
         if include_sensitive:
@@ -8,26 +8,37 @@ Endpoints:
 - GET /v1/audit-logs/export  CSV export (max 10,000 rows)
 """
 import csv
+import math
 from datetime import datetime
 from io import StringIO
 
-from flask import jsonify, make_response, request
+from flask import Response, jsonify, request, stream_with_context
 from flask_jwt_extended import get_jwt_identity
 from flask_smorest import Blueprint
-from sqlalchemy import false, or_
-from sqlalchemy.orm import joinedload
+from sqlalchemy import false, func, or_, select
+from sqlalchemy.orm import selectinload
 
 from ..extensions import db
 from ..models import AuditLog, User
 from ..schemas.common import ErrorSchema
 from ..security import get_client_ip
-from .helpers import accessible_restaurant_ids, admin_required, get_current_user
+from .helpers import (
+    Keyset,
+    accessible_restaurant_ids,
+    admin_required,
+    get_current_user,
+    paginated_response,
+)
 
 audit_bp = Blueprint(
     'audit', __name__,
     description='Audit log — Admin action history (MFA required)'
 )
 
+# Export CSV : plafond de lignes, et lignes lues puis écrites par lot
+_EXPORT_MAX_ROWS = 10000
+_EXPORT_BATCH_SIZE = 500
+
 
 # ============================================================
 # HELPERS
@@ -100,40 +111,59 @@ def export_audit_logs():
             'message': "L'export des logs nécessite l'activation de l'authentification à deux facteurs",
         }), 403
 
-    query = _apply_audit_filters(AuditLog.query.options(joinedload(AuditLog.user)))
-    query = query.filter(_tenant_scope_filter())
-    logs = query.order_by(AuditLog.created_at.desc()).limit(10000).all()
-
-    output = StringIO()
-    writer = csv.writer(output)
-    writer.writerow(['ID', 'Date', 'User', 'Action', 'Target', 'IP', 'Details'])
-
-    for log in logs:
-        writer.writerow([
-            log.id,
-            log.created_at.isoformat() if log.created_at else '',
-            log.user.email if log.user else 'System',
-            log.action,
-            f"{log.target_type}:{log.target_id}" if log.target_type else '',
-            log.ip_address or '',
-            log.details or '',
-        ])
+    # Rows are read after the export entry below is committed: bound them to
+    # the log as it is now, so the export does not list itself.
+    last_id = db.session.query(func.max(AuditLog.id)).scalar() or 0
+    # Plain rows rather than AuditLog/User instances: the CSV needs seven
+    # scalars, not the identity map (nor the user's decrypted MFA secret)
+    stmt = _apply_audit_filters(
+        select(
+            AuditLog.id, AuditLog.created_at, User.email, AuditLog.action,
+            AuditLog.target_type, AuditLog.target_id, AuditLog.ip_address, AuditLog.details,
+        ).select_from(AuditLog).outerjoin(User, AuditLog.user_id == User.id)
+    )
+    stmt = stmt.where(_tenant_scope_filter(), AuditLog.id <= last_id)
+    stmt = stmt.order_by(AuditLog.created_at.desc()).limit(_EXPORT_MAX_ROWS)
+    count = db.session.scalar(select(func.count()).select_from(stmt.subquery()))
 
+    # Committed before the body streams: the generator runs after this
+    # function has returned.
     AuditLog.log(
         action=AuditLog.ACTION_AUDIT_LOGS_EXPORT,
         user_id=current_user_id,
         ip_address=get_client_ip(),
         user_agent=request.headers.get('User-Agent'),
-        details={'count': len(logs), 'filters': dict(request.args)}
+        details={'count': count, 'filters': dict(request.args)}
     )
     db.session.commit()
 
-    response = make_response(output.getvalue())
-    response.headers['Content-Type'] = 'text/csv'
-    response.headers['Content-Disposition'] = (
-        f'attachment; filename=audit_logs_{datetime.now().strftime("%Y%m%d_%H%M%S")}.csv'
+    def generate():
+        output = StringIO()
+        writer = csv.writer(output)
+        writer.writerow(['ID', 'Date', 'User', 'Action', 'Target', 'IP', 'Details'])
+        # Server-side cursor, one CSV chunk per batch of rows
+        result = db.session.execute(stmt.execution_options(yield_per=_EXPORT_BATCH_SIZE))
+        for batch in result.partitions():
+            writer.writerows([
+                row.id,
+                row.created_at.isoformat() if row.created_at else '',
+                row.email or 'System',
+                row.action,
+                f"{row.target_type}:{row.target_id}" if row.target_type else '',
+                row.ip_address or '',
+                row.details or '',
+            ] for row in batch)
+            yield output.getvalue()
+            output.seek(0)
+            output.truncate()
+        yield output.getvalue()
+
+    filename = f'audit_logs_{datetime.now().strftime("%Y%m%d_%H%M%S")}.csv'
+    return Response(
+        stream_with_context(generate()),
+        mimetype='text/csv',
+        headers={'Content-Disposition': f'attachment; filename={filename}'},
     )
-    return response
 
 
 # ============================================================
@@ -151,6 +181,8 @@ def get_audit_logs():
     Query params:
     - `page` — Page number (default 1)
     - `per_page` — Entries per page (default 50, max 100)
+    - `cursor` / `limit` — Keyset pagination instead of `page`: pass an empty
+      `cursor` first, then the returned `next_cursor` (no `total`/`pages`)
     - `action` — Filter by action type
     - `user_id` — Filter by user
     - `start_date` — Start date (ISO format)
@@ -165,13 +197,35 @@ def get_audit_logs():
             'message': "La consultation des logs nécessite l'activation de l'authentification à deux facteurs",
         }), 403
 
-    page = request.args.get('page', 1, type=int)
-    per_page = min(request.args.get('per_page', 50, type=int), 100)
-
-    query = _apply_audit_filters(AuditLog.query)
+    # to_dict() reads log.user.email: one IN query for the page's users
+    query = _apply_audit_filters(AuditLog.query.options(selectinload(AuditLog.user).load_only(User.email)))
     query = query.filter(_tenant_scope_filter())
-    query = query.order_by(AuditLog.created_at.desc())
-    paginated = query.paginate(page=page, per_page=per_page, error_out=False)
+    query = query.order_by(AuditLog.created_at.desc(), AuditLog.id.desc())
+
+    if 'cursor' in request.args:
+        page = None
+        response = paginated_response(
+            query, 'logs', lambda log: log.to_dict(), max_per_page=100,
+            keyset=Keyset(
+                (AuditLog.created_at, AuditLog.id), lambda log: (log.created_at, log.id), descending=True,
+            ),
+        )
+    else:
+        page = request.args.get('page', 1, type=int)
+        per_page = min(request.args.get('per_page', 50, type=int), 100)
+        paginated = query.paginate(page=page, per_page=per_page, error_out=False, count=False)
+        # A short page already gives the total; COUNT(*) only when the page is full
+        if len(paginated.items) < paginated.per_page and (paginated.items or paginated.page == 1):
+            total = (paginated.page - 1) * paginated.per_page + len(paginated.items)
+        else:
+            total = query.order_by(None).count()
+        response = jsonify({
+            'logs': [log.to_dict() for log in paginated.items],
+            'total': total,
+            'page': page,
+            'per_page': per_page,
+            'pages': math.ceil(total / paginated.per_page),
+        }), 200
 
     AuditLog.log(
         action=AuditLog.ACTION_AUDIT_LOGS_ACCESS,
@@ -180,15 +234,11 @@ def get_audit_logs():
         user_agent=request.headers.get('User-Agent'),
         details={
             'page': page,
-            'filters': {k: v for k, v in request.args.items() if k not in ['page', 'per_page']},
+            'filters': {
+                k: v for k, v in request.args.items() if k not in ['page', 'per_page', 'cursor', 'limit']
+            },
         }
     )
     db.session.commit()
 
-    return jsonify({
-        'logs': [log.to_dict() for log in paginated.items],
-        'total': paginated.total,
-        'page': page,
-        'per_page': per_page,
-        'pages': paginated.pages,
-    }), 200
+    return response
@@ -50,6 +50,7 @@ from werkzeug.security import check_password_hash, generate_password_hash
 
 from ..extensions import db
 from ..models import ActivationLink, AuditLog, Passkey, User
+from ..models.user import PASSWORD_HASH_METHOD
 from ..schemas import (
     ActivateAccountSchema,
     ChangePasswordSchema,
@@ -71,7 +72,13 @@ auth_bp = Blueprint(
 
 # Precomputed hash used to equalize password-check timing for unknown emails,
 # so an attacker cannot distinguish "no such user" from "wrong password".
-_DUMMY_PASSWORD_HASH = generate_password_hash('mariam-timing-equalizer')
+_DUMMY_PASSWORD_HASH = generate_password_hash('mariam-timing-equalizer', method=PASSWORD_HASH_METHOD)
+
+# Lifetimes of the single-purpose tokens (built once, shared by every request).
+_MFA_PENDING_TTL = timedelta(minutes=10)
+_SETUP_TOKEN_TTL = timedelta(minutes=15)
+_WEBAUTHN_CHALLENGE_TTL = timedelta(seconds=120)
+_TRANSFER_TOKEN_TTL = timedelta(minutes=5)
 
 
 @auth_bp.route('/login', methods=['POST'])
@@ -109,11 +116,17 @@ def login(data):
     if not user.is_active:
         return jsonify({'error': 'Ce compte est désactivé'}), 403
 
+    # Hash produit avec d'anciens paramètres : on profite du mot de passe en
+    # clair pour le mettre à niveau (une seule fois par compte).
+    if user.password_needs_rehash():
+        user.rehash_password(password)
+        db.session.commit()
+
     if user.mfa_enabled:
         mfa_token = create_access_token(
             identity=str(user.id),
             additional_claims={'mfa_pending': True},
-            expires_delta=timedelta(minutes=10)
+            expires_delta=_MFA_PENDING_TTL
         )
         return jsonify({
             'mfa_required': True,
@@ -146,7 +159,6 @@ def verify_mfa(data):
         return jsonify({'error': 'Token MFA et code requis'}), 400
 
     try:
-        from flask_jwt_extended import decode_token
         decoded = decode_token(mfa_token)
 
         if not decoded.get('mfa_pending'):
@@ -825,7 +837,7 @@ def _make_setup_token(user_id: int) -> str:
     return create_access_token(
         identity=str(user_id),
         additional_claims={'setup_phase': True},
-        expires_delta=timedelta(minutes=15),
+        expires_delta=_SETUP_TOKEN_TTL,
     )
 
 
@@ -838,7 +850,7 @@ def _make_challenge_token(user_id: int, challenge_bytes: bytes) -> str:
     return create_access_token(
         identity=str(user_id),
         additional_claims={'webauthn_challenge': challenge_b64, 'webauthn_pending': True},
-        expires_delta=timedelta(seconds=120),
+        expires_delta=_WEBAUTHN_CHALLENGE_TTL,
     )
 
 
@@ -1762,9 +1774,9 @@ def session_transfer_generate():
     transfer_token = create_access_token(
         identity=str(user_id),
         additional_claims={'session_transfer': True},
-        expires_delta=timedelta(minutes=5),
+        expires_delta=_TRANSFER_TOKEN_TTL,
     )
-    return jsonify({'transfer_token': transfer_token, 'expires_in': 300}), 200
+    return jsonify({'transfer_token': transfer_token, 'expires_in': int(_TRANSFER_TOKEN_TTL.total_seconds())}), 200
 
 
 @auth_bp.route('/session-transfer/validate', methods=['POST'])
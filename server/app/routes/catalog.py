@@ -30,6 +30,7 @@ from ..schemas.catalog import (
 )
 from ..security import get_client_ip, limiter
 from ..services.storage import storage
+from ..utils.text import fold_accents
 from .helpers import editor_required, get_user_and_restaurant
 
 catalog_bp = Blueprint(
@@ -54,13 +55,6 @@ def _build_dish_dict(dish: DishCatalog) -> dict:
     return dish.to_dict(usage_count=usage)
 
 
-def _normalize(text: str) -> str:
-    """Normalise un texte pour la comparaison (lowercase, sans accents)."""
-    import unicodedata
-    nfkd = unicodedata.normalize('NFKD', text.lower())
-    return ''.join(c for c in nfkd if not unicodedata.combining(c))
-
-
 def _capitalize_name(name: str) -> str:
     """Première lettre en majuscule, trim des espaces superflus."""
     cleaned = re.sub(r'\s+', ' ', name.strip())
@@ -107,8 +101,8 @@ def list_dishes():
     dishes = query.all()
 
     if q:
-        q_norm = _normalize(q)
-        dishes = [d for d in dishes if q_norm in _normalize(d.name)]
+        q_norm = fold_accents(q)
+        dishes = [d for d in dishes if q_norm in fold_accents(d.name)]
 
     # Calcul usage_count via une seule requête groupée
     dish_ids = [d.id for d in dishes]
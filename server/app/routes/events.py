@@ -49,6 +49,10 @@ events_bp = Blueprint(
     description='Events — Public display and editor management'
 )
 
+_INVALID_VISIBILITY_ERROR = (
+    f"Visibilité invalide. Valeurs: {', '.join(sorted(Event.VALID_VISIBILITY))}"
+)
+
 
 # ============================================================
 # HELPERS
@@ -150,18 +154,20 @@ def list_events():
         today = paris_today()
         today_event = None
         upcoming_events = []
+        # Chaque événement est sérialisé une fois, puis référencé dans les deux listes
+        payloads = [event.to_dict(include_images=True) for event in events]
 
-        for event in events:
+        for event, payload in zip(events, payloads, strict=True):
             if event.event_date == today:
-                today_event = event.to_dict(include_images=True)
+                today_event = payload
             else:
-                upcoming_events.append(event.to_dict(include_images=True))
+                upcoming_events.append(payload)
 
         return jsonify({
             'today_event': today_event,
             'upcoming_events': upcoming_events,
             # Rétrocompatibilité
-            'events': [event.to_dict(include_images=True) for event in events],
+            'events': payloads,
         }), 200
 
 
@@ -193,7 +199,7 @@ def create_event(data):
 
     visibility = data.get('visibility', 'all')
     if visibility not in Event.VALID_VISIBILITY:
-        return jsonify({'error': f'Visibilité invalide. Valeurs: {Event.VALID_VISIBILITY}'}), 400
+        return jsonify({'error': _INVALID_VISIBILITY_ERROR}), 400
 
     status = data.get('status', 'draft')
     if status not in Event.VALID_STATUS:
@@ -298,7 +304,7 @@ def update_event(data, event_id):
         if data['visibility'] in Event.VALID_VISIBILITY:
             event.visibility = data['visibility']
         else:
-            return jsonify({'error': f'Visibilité invalide. Valeurs: {Event.VALID_VISIBILITY}'}), 400
+            return jsonify({'error': _INVALID_VISIBILITY_ERROR}), 400
 
     if 'status' in data and data['status'] in Event.VALID_STATUS:
         event.status = data['status']
@@ -580,5 +586,5 @@ def reorder_event_images(event_id):
 
     return jsonify({
         'message': 'Images réordonnées',
-        'images': [img.to_dict() for img in event.images.order_by(EventImage.order)],
+        'images': [img.to_dict() for img in event.images],
     }), 200
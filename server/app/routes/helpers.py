@@ -1,9 +1,17 @@
 """Helpers partagés entre les routes authentifiées."""
+import base64
+import binascii
+import datetime
+import json
 import re
+from collections.abc import Callable
 from functools import wraps
+from typing import Any, NamedTuple
 
-from flask import jsonify, request
+from flask import g, jsonify, request
 from flask_jwt_extended import get_jwt_identity, jwt_required
+from sqlalchemy import tuple_
+from sqlalchemy.orm import defer
 
 from ..extensions import db
 from ..models import DishCatalog, Restaurant, User
@@ -15,8 +23,7 @@ def editor_required(f):
     @wraps(f)
     @jwt_required()
     def decorated_function(*args, **kwargs):
-        current_user_id = int(get_jwt_identity())
-        user = User.query.get(current_user_id)
+        user = get_current_user()
         if not user or not user.is_editor():
             return jsonify({'error': 'Accès réservé aux éditeurs'}), 403
         return f(*args, **kwargs)
@@ -28,14 +35,25 @@ def admin_required(f):
     @wraps(f)
     @jwt_required()
     def decorated_function(*args, **kwargs):
-        current_user_id = int(get_jwt_identity())
-        user = User.query.get(current_user_id)
+        user = get_current_user()
         if not user or not user.is_admin():
             return jsonify({'error': 'Accès réservé aux administrateurs'}), 403
         return f(*args, **kwargs)
     return decorated_function
 
 
+def conditional_json(payload):
+    """JSON response with an ETag; answers 304 when the client already has it.
+
+    For payloads that rarely change and are fetched often (display screens
+    polling the public menu, the taxonomy catalog): most requests end
+    without resending the body.
+    """
+    response = jsonify(payload)
+    response.add_etag()
+    return response.make_conditional(request)
+
+
 def get_default_restaurant():
     """Return the first active restaurant.
 
@@ -51,7 +69,27 @@ def get_current_user():
     identity = get_jwt_identity()
     if not identity:
         return None
-    return User.query.get(int(identity))
+    return load_jwt_user(identity)
+
+
+def load_jwt_user(identity):
+    """User for a JWT identity, loaded at most once per request.
+
+    The token blocklist check loads it first; the role decorators and route
+    code then reuse the instance kept on `g`. The password hash and MFA
+    secret (decrypted on load) are deferred until a route reads them.
+    """
+    user_id = int(identity)
+    cached = g.get('jwt_user')
+    if cached is not None and cached[0] == user_id and cached[1] in db.session:
+        return cached[1]
+    user = db.session.get(
+        User, user_id,
+        options=[defer(User.password_hash), defer(User.mfa_secret)],
+    )
+    if user is not None:
+        g.jwt_user = (user_id, user)
+    return user
 
 
 def get_user_and_restaurant():
@@ -170,18 +208,63 @@ def get_or_create_dish(restaurant_id: int, item_data: dict) -> 'DishCatalog | No
     return dish
 
 
-def paginated_response(query, items_key, serialize, default_per_page=50):
+class Keyset(NamedTuple):
+    """Keyset (cursor) pagination spec for `paginated_response`.
+
+    `columns` are the query's ORDER BY columns, all sorted in the same
+    direction (`descending`) and ending with a unique one; `key(row)`
+    returns their values for a result row.
+    """
+    columns: tuple[Any, ...]
+    key: Callable[[Any], tuple[Any, ...]]
+    descending: bool = False
+
+
+def _encode_cursor(values):
+    raw = json.dumps([v.isoformat() if isinstance(v, datetime.datetime) else v for v in values])
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _cursor_value(col, value):
+    """`value` typed as `col`; ValueError if it does not match the column type."""
+    python_type = col.type.python_type
+    if python_type is datetime.datetime:
+        return datetime.datetime.fromisoformat(value)
+    # bool is an int subclass: a JSON true/false is not a valid id
+    if not isinstance(value, python_type) or (isinstance(value, bool) and python_type is not bool):
+        raise ValueError(f'{col.key}: unexpected {type(value).__name__}')
+    return value
+
+
+def _decode_cursor(columns, cursor):
+    """Cursor values, typed after `columns`, or None if it is malformed."""
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        if not isinstance(values, list) or len(values) != len(columns):
+            return None
+        return tuple(_cursor_value(col, v) for col, v in zip(columns, values, strict=True))
+    except (binascii.Error, ValueError, TypeError):
+        return None
+
+
+def paginated_response(query, items_key, serialize, default_per_page=50, keyset=None, max_per_page=200):
     """JSON envelope for a list endpoint: full list by default, DB-side paginated
     when ``?page=`` is present.
 
     Backward-compatible: without ``page`` the shape stays ``{items_key: [...]}``;
     with it, ``total``/``page``/``per_page``/``has_more`` are added. ``per_page``
-    is capped at 200.
+    is capped at ``max_per_page``.
+
+    With a ``keyset``, ``?cursor=`` (empty for the first page) and ``?limit=``
+    page by ``WHERE (columns) < cursor`` instead: no COUNT, no OFFSET scan.
+    ``next_cursor``/``limit``/``has_more`` are added.
     """
+    if keyset is not None and 'cursor' in request.args:
+        return _keyset_response(query, items_key, serialize, default_per_page, max_per_page, keyset)
     page = request.args.get('page', type=int)
     if page is None:
         return jsonify({items_key: [serialize(o) for o in query.all()]}), 200
-    per_page = min(request.args.get('per_page', default_per_page, type=int), 200)
+    per_page = min(request.args.get('per_page', default_per_page, type=int), max_per_page)
     pagination = query.paginate(page=page, per_page=per_page, error_out=False)
     return jsonify({
         items_key: [serialize(o) for o in pagination.items],
@@ -190,3 +273,23 @@ def paginated_response(query, items_key, serialize, default_per_page=50):
         'per_page': per_page,
         'has_more': pagination.has_next,
     }), 200
+
+
+def _keyset_response(query, items_key, serialize, default_per_page, max_per_page, keyset):
+    limit = max(1, min(request.args.get('limit', default_per_page, type=int), max_per_page))
+    cursor = request.args['cursor']
+    if cursor:
+        values = _decode_cursor(keyset.columns, cursor)
+        if values is None:
+            return jsonify({'error': 'Curseur de pagination invalide'}), 400
+        position = tuple_(*keyset.columns)
+        query = query.filter(position < values if keyset.descending else position > values)
+    rows = query.limit(limit + 1).all()
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    return jsonify({
+        items_key: [serialize(o) for o in rows],
+        'limit': limit,
+        'next_cursor': _encode_cursor(keyset.key(rows[-1])) if has_more else None,
+        'has_more': has_more,
+    }), 200
@@ -42,6 +42,7 @@ from ..schemas.imports import (
 )
 from ..security import get_client_ip
 from ..services.csv_import import (
+    KeywordMatcher,
     clean_item_name,
     detect_tags_from_text,
     normalize_label,
@@ -144,6 +145,7 @@ def build_menus_from_rows(rows, column_mapping, date_config, restaurant_id):
     skip_weekends = date_config.get('skip_weekends', True)
     date_format = date_config.get('date_format')
     auto_detect_tags = date_config.get('auto_detect_tags', True)
+    matcher = KeywordMatcher.from_db() if auto_detect_tags else None
 
     if date_mode in ['align_week', 'start_date'] and start_date_str:
         try:
@@ -183,7 +185,7 @@ def build_menus_from_rows(rows, column_mapping, date_config, restaurant_id):
                     'certifications': [],
                 }
                 if auto_detect_tags:
-                    detected = detect_tags_from_text(item_name)
+                    detected = detect_tags_from_text(item_name, matcher)
                     item['tags'] = detected['tags']
                     item['certifications'] = detected['certifications']
                 items.append(item)
@@ -485,6 +487,7 @@ def build_catalog_dishes(session, name_column, tag_columns, auto_detect_tags, ex
     """
     dishes = []
     seen: set[str] = set()
+    matcher = KeywordMatcher.from_db()
     for row in session.get_rows():
         raw = (row.get(name_column) or '').strip()
         if not raw:
@@ -499,7 +502,7 @@ def build_catalog_dishes(session, name_column, tag_columns, auto_detect_tags, ex
         if auto_detect_tags:
             parts.append(raw)
         text = ' '.join(p for p in parts if p)
-        detected = detect_tags_from_text(text) if text.strip() else {'tags': [], 'certifications': []}
+        detected = detect_tags_from_text(text, matcher) if text.strip() else {'tags': [], 'certifications': []}
 
         dishes.append({
             'name': name,
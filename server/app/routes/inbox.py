@@ -15,14 +15,14 @@ Endpoints :
 - GET    /v1/inbox/notification-preferences  Préférences de notification de l'utilisateur
 - PUT    /v1/inbox/notification-preferences  Met à jour les préférences
 """
-from datetime import UTC, date, datetime, timedelta
+from datetime import date, timedelta
 
 from flask import jsonify
 from flask_jwt_extended import get_jwt_identity, jwt_required
 from flask_smorest import Blueprint
 
 from ..extensions import db
-from ..models import User
+from ..models import Menu, RestaurantServiceHours, User
 from ..models.notification import Notification
 from ..schemas.common import ErrorSchema, MessageSchema
 from ..schemas.inbox import (
@@ -32,6 +32,7 @@ from ..schemas.inbox import (
     UnreadCountSchema,
 )
 from ..services import holidays
+from ..utils.time import paris_now
 from .helpers import get_user_and_restaurant
 
 inbox_bp = Blueprint(
@@ -198,15 +199,6 @@ def update_notification_preferences():
 # LIVE ALERTS — calculées en temps réel, aucune persistance DB
 # ============================================================
 
-def _paris_now() -> datetime:
-    """Retourne l'heure courante en heure de Paris."""
-    try:
-        import zoneinfo
-        return datetime.now(zoneinfo.ZoneInfo('Europe/Paris'))
-    except Exception:
-        return datetime.now(UTC) + timedelta(hours=1)
-
-
 @inbox_bp.route('/live-alerts', methods=['GET'])
 @jwt_required()
 @inbox_bp.response(200, LiveAlertListSchema)
@@ -215,15 +207,12 @@ def get_live_alerts():
     """Calcule en temps réel les alertes actives pour l'utilisateur courant.
     Aucune persistance DB — l'état reflète la situation actuelle du restaurant.
     """
-    from ..models import Menu
-    from ..models.restaurant import RestaurantServiceHours
-
     user, restaurant_id = _get_user_and_restaurant_id()
     if not user or not restaurant_id:
         return jsonify({'alerts': []}), 200
 
     prefs = user.get_notification_preferences()
-    now = _paris_now()
+    now = paris_now()
     today_str = now.strftime('%Y-%m-%d')
     today_date = date.fromisoformat(today_str)
     current_time = now.strftime('%H:%M')
@@ -238,7 +227,7 @@ def get_live_alerts():
             date=today_date,
             status='published',
         ).first()
-        menu_published = published_menu is not None and published_menu.items.count() > 0
+        menu_published = published_menu is not None and bool(published_menu.items)
 
         if not menu_published:
             alerts.append({
@@ -25,6 +25,7 @@ Editor endpoints (JWT required):
 - GET  /v1/menus/<id>/substitutions                  Substitution dishes by category
 - PUT  /v1/menus/<id>/substitutions/<category_id>    Set substitutions for a category
 """
+import json
 from datetime import UTC, datetime, timedelta
 
 from flask import jsonify, request
@@ -53,7 +54,7 @@ from ..schemas.menus import (
     PublicDayMenuSchema,
     WeekMenuSchema,
 )
-from ..security import get_client_ip, limiter
+from ..security import _get_blacklist_redis, get_client_ip, limiter
 from ..services import holidays
 from ..services.storage import storage
 from ..utils.time import PARIS_TZ, paris_today
@@ -70,6 +71,8 @@ menus_bp = Blueprint(
     description='Menus — Public display and editor management'
 )
 
+_DAY_NAMES = ('Lundi', 'Mardi', 'Mercredi', 'Jeudi', 'Vendredi', 'Samedi', 'Dimanche')
+
 
 # ============================================================
 # HELPERS
@@ -195,7 +198,7 @@ def _format_menu_for_display(menu):
             cat_dict['items'] = items_by_cat.get(cat.id, [])
         by_category.append(cat_dict)
 
-    images_list = [img.to_dict() for img in menu.images] if hasattr(menu, 'images') else []
+    images_list = [img.to_dict() for img in menu.images]
 
     # Plats de substitution par catégorie (affichés si is_out_of_stock)
     category_ids = list({item.category_id for item in menu.items})
@@ -242,11 +245,9 @@ def get_today_menu():
     ).first()
 
     restaurant = Restaurant.query.get(restaurant_id)
-    day_names = ['Lundi', 'Mardi', 'Mercredi', 'Jeudi', 'Vendredi', 'Samedi', 'Dimanche']
-
     return jsonify({
         'date': today.isoformat(),
-        'day_name': day_names[today.weekday()],
+        'day_name': _DAY_NAMES[today.weekday()],
         'restaurant': restaurant.to_dict(include_config=True) if restaurant else None,
         'menu': _format_menu_for_display(menu),
     }), 200
@@ -271,11 +272,9 @@ def get_tomorrow_menu():
     ).first()
 
     restaurant = Restaurant.query.get(restaurant_id)
-    day_names = ['Lundi', 'Mardi', 'Mercredi', 'Jeudi', 'Vendredi', 'Samedi', 'Dimanche']
-
     return jsonify({
         'date': tomorrow.isoformat(),
-        'day_name': day_names[tomorrow.weekday()],
+        'day_name': _DAY_NAMES[tomorrow.weekday()],
         'restaurant': restaurant.to_dict(include_config=True) if restaurant else None,
         'menu': _format_menu_for_display(menu),
     }), 200
@@ -322,8 +321,6 @@ def get_week_menu():
 
     reference_date = paris_today() + timedelta(weeks=week_offset)
     week_dates = get_week_dates(reference_date)
-    day_names = ['Lundi', 'Mardi', 'Mercredi', 'Jeudi', 'Vendredi', 'Samedi', 'Dimanche']
-
     menus = {}
     if is_editor:
         service_days = restaurant.get_service_days() if restaurant else [0, 1, 2, 3, 4]
@@ -344,7 +341,7 @@ def get_week_menu():
                 restaurant_id=restaurant_id, date=d, status='published'
             ).first()
             menus[d.isoformat()] = {
-                'day_name': day_names[i],
+                'day_name': _DAY_NAMES[i],
                 'menu': _format_menu_for_display(menu),
             }
 
@@ -590,7 +587,7 @@ def publish_menu(menu_id):
     if not menu:
         return jsonify({'error': 'Menu non trouvé'}), 404
 
-    if menu.items.count() == 0:
+    if not menu.items:
         return jsonify({'error': 'Impossible de publier un menu vide'}), 400
 
     menu.status = 'published'
@@ -840,7 +837,7 @@ def reorder_menu_images(menu_id):
     db.session.commit()
     return jsonify({
         'message': 'Images réordonnées',
-        'images': [img.to_dict() for img in menu.images.order_by(MenuImage.order)],
+        'images': [img.to_dict() for img in menu.images],
     }), 200
 
 
@@ -962,12 +959,8 @@ def get_vacances_scolaires(year):
     Cache Redis 24h. Zone : A, B ou C.
     Response: { vacances: [{ start_date, end_date, description }] }
     """
-    import json as _json
-
     import requests as http_requests
 
-    from ..security import _get_blacklist_redis
-
     if year < 2020 or year > 2040:
         return jsonify({'error': 'Année hors plage (2020-2040)'}), 400
 
@@ -982,7 +975,7 @@ def get_vacances_scolaires(year):
         try:
             cached = r.get(cache_key)
             if cached:
-                return jsonify({'vacances': _json.loads(cached)}), 200
+                return jsonify({'vacances': json.loads(cached)}), 200
         except Exception:
             pass
 
@@ -1036,7 +1029,7 @@ def get_vacances_scolaires(year):
 
     if r and result:
         try:
-            r.setex(cache_key, 86400, _json.dumps(result))
+            r.setex(cache_key, 86400, json.dumps(result))
         except Exception:
             pass
 
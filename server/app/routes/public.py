@@ -22,6 +22,7 @@ from flask_smorest import Blueprint
 from ..models import Event, ExceptionalClosure, Menu, Organization, Restaurant
 from ..security import limiter
 from ..utils.time import paris_today
+from .helpers import conditional_json
 from .menus import _format_menu_for_display
 
 public_bp = Blueprint('public', __name__, description='Public tenant-scoped display API')
@@ -62,13 +63,24 @@ def resolve_organization():
 
 
 def resolve_restaurant(restaurant_slug: str):
-    """Return the active restaurant for the current Host + path slug, or None."""
-    org = resolve_organization()
-    if not org:
+    """Return the active restaurant for the current Host + path slug, or None.
+
+    One joined query rather than organization then restaurant: this runs on
+    every public menu request.
+    """
+    slug = org_slug_from_host(request.host)
+    if not slug:
         return None
-    return Restaurant.query.filter_by(
-        organization_id=org.id, slug=restaurant_slug, is_active=True
-    ).first()
+    return (
+        Restaurant.query.join(Organization, Restaurant.organization_id == Organization.id)
+        .filter(
+            Organization.slug == slug,
+            Organization.is_active.is_(True),
+            Restaurant.slug == restaurant_slug,
+            Restaurant.is_active.is_(True),
+        )
+        .first()
+    )
 
 
 def _restaurant_or_404(restaurant_slug: str):
@@ -125,7 +137,7 @@ def public_today(restaurant_slug):
     restaurant, err = _restaurant_or_404(restaurant_slug)
     if err:
         return err
-    return jsonify(_day_payload(restaurant, paris_today())), 200
+    return conditional_json(_day_payload(restaurant, paris_today()))
 
 
 @public_bp.route('/<restaurant_slug>/tomorrow', methods=['GET'])
@@ -134,7 +146,7 @@ def public_tomorrow(restaurant_slug):
     restaurant, err = _restaurant_or_404(restaurant_slug)
     if err:
         return err
-    return jsonify(_day_payload(restaurant, paris_today() + timedelta(days=1))), 200
+    return conditional_json(_day_payload(restaurant, paris_today() + timedelta(days=1)))
 
 
 @public_bp.route('/<restaurant_slug>/week', methods=['GET'])
@@ -147,21 +159,25 @@ def public_week(restaurant_slug):
     monday = paris_today() + timedelta(weeks=week_offset)
     monday = monday - timedelta(days=monday.weekday())
     week_dates = [monday + timedelta(days=i) for i in range(7)]
+    published = {
+        m.date: m for m in Menu.query.filter(
+            Menu.restaurant_id == restaurant.id,
+            Menu.date.in_(week_dates),
+            Menu.status == 'published',
+        )
+    }
     menus = {}
     for i, d in enumerate(week_dates):
-        menu = Menu.query.filter_by(
-            restaurant_id=restaurant.id, date=d, status='published'
-        ).first()
         menus[d.isoformat()] = {
             'day_name': _DAY_NAMES[i],
-            'menu': _format_menu_for_display(menu),
+            'menu': _format_menu_for_display(published.get(d)),
         }
-    return jsonify({
+    return conditional_json({
         'week_start': week_dates[0].isoformat(),
         'week_end': week_dates[6].isoformat(),
         'restaurant': restaurant.to_dict(include_config=True),
         'menus': menus,
-    }), 200
+    })
 
 
 # ============================================================
@@ -189,8 +205,8 @@ def public_events(restaurant_slug):
 
     today_event = None
     upcoming = []
-    for event in events:
-        payload = event.to_dict(include_images=True)
+    payloads = [event.to_dict(include_images=True) for event in events]
+    for event, payload in zip(events, payloads, strict=True):
         if event.event_date == today:
             today_event = payload
         else:
@@ -198,7 +214,7 @@ def public_events(restaurant_slug):
     return jsonify({
         'today_event': today_event,
         'upcoming_events': upcoming,
-        'events': [e.to_dict(include_images=True) for e in events],
+        'events': payloads,
     }), 200
 
 
@@ -239,4 +255,4 @@ def public_restaurant(restaurant_slug):
     restaurant, err = _restaurant_or_404(restaurant_slug)
     if err:
         return err
-    return jsonify({'restaurant': restaurant.to_dict(include_config=True)}), 200
+    return conditional_json({'restaurant': restaurant.to_dict(include_config=True)})
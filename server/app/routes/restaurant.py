@@ -26,6 +26,7 @@ from ..schemas.restaurant import RestaurantSchema, RestaurantUpdateSchema
 from ..security import get_client_ip, limiter
 from ..utils.slug import is_valid_slug, normalize_slug
 from .helpers import (
+    Keyset,
     accessible_restaurant_ids,
     admin_required,
     get_active_restaurant,
@@ -247,8 +248,11 @@ def list_restaurants():
     ids = accessible_restaurant_ids(get_current_user())
     if not ids:
         return jsonify({'restaurants': []}), 200
-    query = Restaurant.query.filter(Restaurant.id.in_(ids)).order_by(Restaurant.name)
-    return paginated_response(query, 'restaurants', lambda r: r.to_dict())
+    query = Restaurant.query.filter(Restaurant.id.in_(ids)).order_by(Restaurant.name, Restaurant.id)
+    return paginated_response(
+        query, 'restaurants', lambda r: r.to_dict(),
+        keyset=Keyset((Restaurant.name, Restaurant.id), lambda r: (r.name, r.id)),
+    )
 
 
 @restaurant_bp.route('/restaurants', methods=['POST'])
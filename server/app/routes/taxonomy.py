@@ -7,10 +7,10 @@ for certifications, and to populate admin selectors.
 Public endpoints:
 - GET /v1/taxonomy   Full dietary tag and certification catalog
 """
-from flask import jsonify
+from flask import current_app, request
 from flask_smorest import Blueprint
 
-from ..models import CertificationCategory, DietaryTagCategory
+from ..models.taxonomy import taxonomy_catalog_json
 from ..schemas.taxonomy import TaxonomySchema
 from ..security import limiter
 
@@ -33,15 +33,9 @@ def get_taxonomy():
     - Display labels, icons and colors
     - Render SVG logos for certifications
     - Populate selectors in the admin interface
+
+    Served pre-serialized from an in-process cache, with an ETag (304 on `If-None-Match`).
     """
-    tag_categories = DietaryTagCategory.query.order_by(
-        DietaryTagCategory.sort_order
-    ).all()
-    cert_categories = CertificationCategory.query.order_by(
-        CertificationCategory.sort_order
-    ).all()
-
-    return jsonify({
-        'dietary_tag_categories': [c.to_dict() for c in tag_categories],
-        'certification_categories': [c.to_dict() for c in cert_categories],
-    }), 200
+    response = current_app.response_class(taxonomy_catalog_json(), mimetype=current_app.json.mimetype)
+    response.add_etag()
+    return response.make_conditional(request)
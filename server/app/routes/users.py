@@ -15,13 +15,17 @@ Endpoints:
 from flask import jsonify
 from flask_jwt_extended import get_jwt_identity
 from flask_smorest import Blueprint
+from sqlalchemy import func, select
+from sqlalchemy.orm import defer
 
 from ..extensions import db
-from ..models import ActivationLink, AuditLog, User
+from ..models import ActivationLink, AuditLog, Passkey, User
 from ..schemas.common import ErrorSchema, MessageSchema
 from ..schemas.users import InvitationSchema, InviteSchema, UserAdminSchema, UserUpdateSchema
 from ..security import get_client_ip
+from ..utils.time import utcnow
 from .helpers import (
+    Keyset,
     accessible_restaurant_ids,
     admin_required,
     get_current_user,
@@ -47,7 +51,10 @@ def _scoped_user(user_id):
     ids = accessible_restaurant_ids(caller)
     if not ids:
         return None
-    target = User.query.filter(User.id == user_id, User.restaurant_id.in_(ids)).first()
+    # Never serialized: skip loading the hash and decrypting the MFA secret
+    target = User.query.options(defer(User.password_hash), defer(User.mfa_secret)).filter(
+        User.id == user_id, User.restaurant_id.in_(ids)
+    ).first()
     if not target:
         return None
     if target.is_org_admin() and not caller.is_org_admin():
@@ -80,7 +87,7 @@ def create_invitation(data):
         return jsonify({'error': 'Email requis'}), 400
 
     if role not in User.VALID_ROLES:
-        return jsonify({'error': f'Rôle invalide. Valeurs possibles: {User.VALID_ROLES}'}), 400
+        return jsonify({'error': f'Rôle invalide. Valeurs possibles: {", ".join(User.VALID_ROLES)}'}), 400
 
     if role == User.ROLE_ORG_ADMIN and not inviter.is_org_admin():
         return jsonify({'error': "Seul un directeur d'organisation peut inviter à ce rôle"}), 403
@@ -141,7 +148,10 @@ def list_invitations():
         if ids else []
     )
 
-    return jsonify({'invitations': [link.to_dict(include_token=True) for link in links]}), 200
+    now = utcnow()
+    return jsonify({
+        'invitations': [link.to_dict(include_token=True, now=now) for link in links],
+    }), 200
 
 
 # ============================================================
@@ -161,11 +171,27 @@ def list_users():
     ids = accessible_restaurant_ids(caller)
     if not ids:
         return jsonify({'users': []}), 200
-    query = User.query.filter(User.restaurant_id.in_(ids))
+    # Passkey count as a correlated subquery (not one COUNT per user); the
+    # secrets are never serialized, so skip loading (and decrypting) them.
+    passkeys_count = (
+        select(func.count(Passkey.id))
+        .where(Passkey.user_id == User.id)
+        .correlate(User)
+        .scalar_subquery()
+    )
+    query = (
+        User.query.options(defer(User.password_hash), defer(User.mfa_secret))
+        .add_columns(passkeys_count)
+        .filter(User.restaurant_id.in_(ids))
+    )
     if not caller.is_org_admin():
         query = query.filter(User.role != User.ROLE_ORG_ADMIN)
-    query = query.order_by(User.created_at.desc())
-    return paginated_response(query, 'users', lambda u: u.to_dict(include_sensitive=True))
+    query = query.order_by(User.created_at.desc(), User.id.desc())
+    return paginated_response(
+        query, 'users',
+        lambda row: row[0].to_dict(include_sensitive=True, passkeys_count=row[1]),
+        keyset=Keyset((User.created_at, User.id), lambda row: (row[0].created_at, row[0].id), descending=True),
+    )
 
 
 @users_bp.route('/<int:user_id>', methods=['GET'])
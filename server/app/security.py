@@ -78,6 +78,8 @@ def get_client_ip():
 
 # Redis URL depuis l'environnement (Upstash ou Redis managé)
 # Fallback sur memory:// en développement local
+# limiter.init_app() n'ouvre aucune connexion : le client redis-py se connecte
+# au premier appel, donc uniquement sur une route limitée (pas /health).
 REDIS_URL = os.environ.get('REDIS_URL', 'memory://')
 
 limiter = Limiter(
@@ -8,9 +8,9 @@ s'appuie sur les mots-clés de taxonomie stockés en base.
 import csv
 import io
 import re
-import unicodedata
 
 from ..models import CertificationKeyword, DietaryTagKeyword
+from ..utils.text import fold_accents
 
 
 def detect_encoding(file_content: bytes) -> str:
@@ -102,25 +102,71 @@ def parse_upload(file) -> tuple[list[str], list[dict], str | None]:
 
 def normalize_label(label: str) -> str:
     """Normalise un label pour la comparaison (minuscules, sans accents)."""
-    label = label.lower().strip()
-    return ''.join(
-        c for c in unicodedata.normalize('NFD', label)
-        if unicodedata.category(c) != 'Mn'
-    )
-
-
-def detect_tags_from_text(text: str) -> dict:
-    """Détecte tags alimentaires et certifications dans un texte via les mots-clés DB."""
-    text_lower = text.lower()
-    detected_tag_ids: set[str] = set()
-    detected_cert_ids: set[str] = set()
-    for tk in DietaryTagKeyword.query.all():
-        if tk.keyword in text_lower:
-            detected_tag_ids.add(tk.tag_id)
-    for ck in CertificationKeyword.query.all():
-        if ck.keyword in text_lower:
-            detected_cert_ids.add(ck.certification_id)
-    return {'tags': sorted(detected_tag_ids), 'certifications': sorted(detected_cert_ids)}
+    return fold_accents(label.strip())
+
+
+class KeywordMatcher:
+    """Mots-clés de taxonomie chargés une seule fois pour tout un import.
+
+    Tous les mots-clés sont compilés en une seule expression régulière : un
+    passage sur le texte remplace un test `in` par mot-clé. Mots-clés et texte
+    sont comparés sans casse ni accents ("vegetarien" trouve "végétarien"). Un
+    import réutilise la même instance pour toutes ses lignes.
+    """
+
+    def __init__(self, tag_keywords, cert_keywords):
+        index: dict[str, tuple[set[str], set[str]]] = {}
+        for keyword, tag_id in tag_keywords:
+            index.setdefault(fold_accents(keyword), (set(), set()))[0].add(tag_id)
+        for keyword, cert_id in cert_keywords:
+            index.setdefault(fold_accents(keyword), (set(), set()))[1].add(cert_id)
+
+        # L'expression ne renvoie que le plus long mot-clé à chaque position :
+        # chaque mot-clé porte donc aussi les ids de ceux qu'il contient
+        # ("sans gluten" implique "gluten"), ce qui conserve la sémantique
+        # « tout mot-clé présent dans le texte ».
+        self._hits: dict[str, tuple[frozenset[str], frozenset[str]]] = {}
+        for keyword in index:
+            tags: set[str] = set()
+            certs: set[str] = set()
+            for other, (other_tags, other_certs) in index.items():
+                if other in keyword:
+                    tags |= other_tags
+                    certs |= other_certs
+            self._hits[keyword] = (frozenset(tags), frozenset(certs))
+
+        keywords = sorted(index, key=len, reverse=True)
+        self._pattern = (
+            re.compile('(?=(' + '|'.join(map(re.escape, keywords)) + '))')
+            if keywords else None
+        )
+
+    @classmethod
+    def from_db(cls) -> 'KeywordMatcher':
+        return cls(
+            DietaryTagKeyword.query.with_entities(
+                DietaryTagKeyword.keyword, DietaryTagKeyword.tag_id).all(),
+            CertificationKeyword.query.with_entities(
+                CertificationKeyword.keyword, CertificationKeyword.certification_id).all(),
+        )
+
+    def detect(self, text: str) -> dict:
+        detected_tag_ids: set[str] = set()
+        detected_cert_ids: set[str] = set()
+        if self._pattern is not None:
+            for keyword in {m.group(1) for m in self._pattern.finditer(fold_accents(text))}:
+                tag_ids, cert_ids = self._hits[keyword]
+                detected_tag_ids |= tag_ids
+                detected_cert_ids |= cert_ids
+        return {'tags': sorted(detected_tag_ids), 'certifications': sorted(detected_cert_ids)}
+
+
+def detect_tags_from_text(text: str, matcher: KeywordMatcher | None = None) -> dict:
+    """Détecte tags alimentaires et certifications dans un texte via les mots-clés DB.
+
+    Passer un `KeywordMatcher` partagé lorsqu'on analyse plusieurs textes.
+    """
+    return (matcher or KeywordMatcher.from_db()).detect(text)
 
 
 def clean_item_name(name: str) -> str:
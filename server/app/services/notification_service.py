@@ -17,6 +17,8 @@ from ..utils.time import paris_now, paris_today
 
 logger = logging.getLogger(__name__)
 
+_DAY_NAMES = ('lundi', 'mardi', 'mercredi', 'jeudi', 'vendredi', 'samedi', 'dimanche')
+
 
 # ========================================
 # Configuration VAPID
@@ -167,8 +169,7 @@ def build_tomorrow_menu_payload(menu_items: list[dict]) -> dict | None:
         return None
 
     tomorrow = paris_today() + timedelta(days=1)
-    day_names = ['lundi', 'mardi', 'mercredi', 'jeudi', 'vendredi', 'samedi', 'dimanche']
-    day_name = day_names[tomorrow.weekday()]
+    day_name = _DAY_NAMES[tomorrow.weekday()]
 
     return {
         'title': f'\U0001F37D\uFE0F Menu de demain ({day_name})',
@@ -329,8 +330,6 @@ def _check_event_notifications(db, now, sent_count: int) -> int:
     target_7d = today + timedelta(days=7)
     target_1d = today + timedelta(days=1)
 
-    day_names = ['lundi', 'mardi', 'mercredi', 'jeudi', 'vendredi', 'samedi', 'dimanche']
-
     # Événements publiés à J-7 ou J-1
     events = Event.query.filter(
         Event.status == 'published',
@@ -346,7 +345,7 @@ def _check_event_notifications(db, now, sent_count: int) -> int:
         if not is_7d and not is_1d:
             continue
 
-        date_str = day_names[event.event_date.weekday()] + ' ' + event.event_date.strftime('%d/%m')
+        date_str = _DAY_NAMES[event.event_date.weekday()] + ' ' + event.event_date.strftime('%d/%m')
 
         if is_1d:
             payload = build_event_payload(event.title, date_str, reminder='tomorrow')
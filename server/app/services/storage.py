@@ -9,10 +9,10 @@ import io
 import json
 import logging
 import os
+import threading
 import uuid
 from datetime import UTC, datetime
 
-import boto3
 import pillow_heif
 from botocore.exceptions import ClientError
 from PIL import Image, ImageOps
@@ -41,14 +41,20 @@ class StorageService:
     }
 
     def __init__(self, app=None):
-        self.client = None
+        self._client = None
+        self._client_kwargs = None
+        self._client_lock = threading.Lock()
         self.bucket = None
         self.public_url = None
         if app:
             self.init_app(app)
 
     def init_app(self, app):
-        """Initialise le service avec la configuration Flask."""
+        """Initialise le service avec la configuration Flask.
+
+        Aucune I/O ici : le client boto3 (import lourd) et la vérification du
+        bucket sont faits au premier appel S3 (voir `client`).
+        """
         endpoint_url = app.config.get('S3_ENDPOINT_URL')
         access_key = app.config.get('S3_ACCESS_KEY_ID')
         secret_key = app.config.get('S3_SECRET_ACCESS_KEY')
@@ -63,17 +69,13 @@ class StorageService:
             )
             return
 
-        self.client = boto3.client(
-            's3',
-            endpoint_url=endpoint_url,
-            aws_access_key_id=access_key,
-            aws_secret_access_key=secret_key,
-            region_name=region,
-        )
-
-        # Créer le bucket s'il n'existe pas (utile pour MinIO en dev)
-        self._ensure_bucket()
-
+        self._client = None
+        self._client_kwargs = {
+            'endpoint_url': endpoint_url,
+            'aws_access_key_id': access_key,
+            'aws_secret_access_key': secret_key,
+            'region_name': region,
+        }
         app.logger.info(f"✅ S3 storage configured (bucket: {self.bucket})")
 
     # ------------------------------------------------------------------
@@ -83,7 +85,21 @@ class StorageService:
     @property
     def is_configured(self) -> bool:
         """Vérifie si le service S3 est opérationnel."""
-        return self.client is not None
+        return self._client_kwargs is not None
+
+    @property
+    def client(self):
+        """Client boto3, créé au premier usage (puis bucket vérifié/créé)."""
+        if self._client is None and self._client_kwargs is not None:
+            with self._client_lock:
+                if self._client is None:
+                    import boto3
+
+                    client = boto3.client('s3', **self._client_kwargs)
+                    # Créer le bucket s'il n'existe pas (utile pour MinIO en dev)
+                    self._ensure_bucket(client)
+                    self._client = client
+        return self._client
 
     # ------------------------------------------------------------------
     # Méthodes publiques
@@ -157,7 +173,7 @@ class StorageService:
         if self.public_url:
             return f"{self.public_url}/{key}"
         # Fallback : URL directe via l'endpoint S3
-        endpoint = self.client._endpoint.host
+        endpoint = self._client_kwargs['endpoint_url'].rstrip('/')
         return f"{endpoint}/{self.bucket}/{key}"
 
     # ------------------------------------------------------------------
@@ -235,15 +251,15 @@ class StorageService:
     # Méthodes internes
     # ------------------------------------------------------------------
 
-    def _ensure_bucket(self):
+    def _ensure_bucket(self, client):
         """Crée le bucket s'il n'existe pas (utile pour MinIO en dev)."""
         try:
-            self.client.head_bucket(Bucket=self.bucket)
+            client.head_bucket(Bucket=self.bucket)
         except ClientError:
             try:
-                self.client.create_bucket(Bucket=self.bucket)
+                client.create_bucket(Bucket=self.bucket)
                 # Politique de lecture publique pour les images
-                self.client.put_bucket_policy(
+                client.put_bucket_policy(
                     Bucket=self.bucket,
                     Policy=json.dumps({
                         "Version": "2012-10-17",
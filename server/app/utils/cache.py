@@ -0,0 +1,36 @@
+import time
+from collections.abc import Callable
+from typing import Generic, TypeVar
+
+T = TypeVar('T')
+
+
+class _TTLCached(Generic[T]):
+    def __init__(self, func: Callable[[], T], seconds: float):
+        self._func = func
+        self._seconds = seconds
+        self._entry: tuple[float, T] | None = None
+        self.__doc__ = func.__doc__
+        self.__wrapped__ = func
+
+    def __call__(self) -> T:
+        entry = self._entry
+        if entry is None or entry[0] <= time.monotonic():
+            entry = (time.monotonic() + self._seconds, self._func())
+            self._entry = entry
+        return entry[1]
+
+    def cache_clear(self) -> None:
+        self._entry = None
+
+
+def ttl_cache(seconds: float) -> Callable[[Callable[[], T]], _TTLCached[T]]:
+    """Cache the result of a zero-argument function for `seconds`.
+
+    Same use as lru_cache(maxsize=1), cache_clear() included, but the value
+    also expires: a write made by another process (`flask seed`), which this
+    process's invalidation hooks never see, is picked up within `seconds`.
+    """
+    def decorator(func: Callable[[], T]) -> _TTLCached[T]:
+        return _TTLCached(func, seconds)
+    return decorator
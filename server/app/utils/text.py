@@ -0,0 +1,29 @@
+"""Text normalization helpers (case and accent folding for comparisons)."""
+import unicodedata
+
+
+def _strip_marks(text: str) -> str:
+    # NFKD, not NFD: compatibility characters fold too (ligatures pasted from
+    # PDFs "ﬁ" -> "fi", full-width "１２" -> "12", superscript "²" -> "2").
+    return ''.join(
+        c for c in unicodedata.normalize('NFKD', text)
+        if unicodedata.category(c) != 'Mn'
+    )
+
+
+# Accented Latin letters (Latin-1 Supplement + Latin Extended-A) mapped to their
+# folded form, so the common case is a single C-level str.translate pass.
+_FOLD_TABLE = {
+    cp: folded
+    for cp in range(0xC0, 0x180)
+    if (folded := _strip_marks(chr(cp))) != chr(cp)
+}
+
+
+def fold_accents(text: str) -> str:
+    """Lowercase and strip combining accents ("Œuf Épicé" -> "œuf epice")."""
+    folded = text.lower().translate(_FOLD_TABLE)
+    if folded.isascii():
+        return folded
+    # Rare characters outside the table (decomposed input, other scripts).
+    return _strip_marks(folded)
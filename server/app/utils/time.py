@@ -1,4 +1,4 @@
-from datetime import date, datetime
+from datetime import UTC, date, datetime
 from zoneinfo import ZoneInfo
 
 PARIS_TZ = ZoneInfo('Europe/Paris')
@@ -14,6 +14,12 @@ def paris_now() -> datetime:
     return datetime.now(PARIS_TZ)
 
 
+def utcnow() -> datetime:
+    """Current UTC time as a naive datetime, the convention of the DateTime columns.
+    Use instead of the deprecated datetime.utcnow()."""
+    return datetime.now(UTC).replace(tzinfo=None)
+
+
 def parse_iso_date(date_str: str | None) -> date | None:
     """Parse a strict ISO date (YYYY-MM-DD); return None if empty or invalid."""
     if not date_str:
@@ -6,22 +6,33 @@ Uses a dedicated PostgreSQL test database (mariam_test_db).
 Run with: docker compose exec backend uv run pytest
 """
 import os
+import re
+from contextlib import contextmanager
+
 import pytest
 import psycopg2
 from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT
+from sqlalchemy import event as sa_event
 from sqlalchemy import text
 from werkzeug.security import generate_password_hash
 
-from app import create_app
-from app.extensions import db as _db
-from app.security import limiter as _limiter
+# Low-cost password hashing for the suite: set before the app is imported.
+# Fixture users and set_password() share it, so get_token() logins neither
+# pay the production scrypt cost (~0.1 s each) nor trigger a rehash.
+os.environ.setdefault('PASSWORD_HASH_METHOD', 'pbkdf2:sha256:1000')
+
+from app import create_app  # noqa: E402
+from app.extensions import db as _db  # noqa: E402
+from app.models.restaurant import default_taxonomy_dicts  # noqa: E402
+from app.models.taxonomy import taxonomy_catalog_json  # noqa: E402
+from app.security import limiter as _limiter  # noqa: E402
 
 _TEST_DB_HOST = os.environ.get('DB_HOST', 'db')
 _TEST_DB_NAME = 'mariam_test_db'
 _TEST_DB_URL = f'postgresql://mariam:mariam_secret@{_TEST_DB_HOST}:5432/{_TEST_DB_NAME}'
 
 TEST_PASSWORD = 'TestPass123!'
-TEST_PASSWORD_HASH = generate_password_hash(TEST_PASSWORD)
+TEST_PASSWORD_HASH = generate_password_hash(TEST_PASSWORD, method=os.environ['PASSWORD_HASH_METHOD'])
 
 
 def _ensure_test_db() -> None:
@@ -88,6 +99,9 @@ def _truncate_all() -> None:
             text(f'TRUNCATE {", ".join(table_names)} RESTART IDENTITY CASCADE')
         )
         _db.session.commit()
+    # TRUNCATE ne déclenche pas les événements ORM qui vident ces caches
+    default_taxonomy_dicts.cache_clear()
+    taxonomy_catalog_json.cache_clear()
 
 
 @pytest.fixture(autouse=True)
@@ -168,3 +182,21 @@ def get_token(client, email=None, password=None):
 def auth_headers(token):
     """Renvoie les headers Authorization pour un token JWT."""
     return {'Authorization': f'Bearer {token}'}
+
+
+@contextmanager
+def count_queries(pattern=None):
+    """Collecte les requêtes SQL exécutées dans le bloc (seulement celles où la
+    regex `pattern` est trouvée, avec re.DOTALL, si elle est fournie)."""
+    regex = re.compile(pattern, re.DOTALL) if pattern else None
+    statements = []
+
+    def _record(conn, cursor, statement, *args):
+        if regex is None or regex.search(statement):
+            statements.append(statement)
+
+    sa_event.listen(_db.engine, 'before_cursor_execute', _record)
+    try:
+        yield statements
+    finally:
+        sa_event.remove(_db.engine, 'before_cursor_execute', _record)
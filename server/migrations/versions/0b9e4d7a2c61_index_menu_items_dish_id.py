@@ -0,0 +1,34 @@
+"""index menu_items dish_id
+
+Revision ID: 0b9e4d7a2c61
+Revises: f3a7c2e91b04
+Create Date: 2026-10-16 15:21:47.093355
+
+Index on menu_items(dish_id): the catalog's usage counts filter on
+dish_id IN (...) and deleting a dish runs the ON DELETE RESTRICT check by
+dish_id. ix_menu_items_menu_id_dish_id leads with menu_id, so neither
+query could seek on it. Built CONCURRENTLY.
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '0b9e4d7a2c61'
+down_revision = 'f3a7c2e91b04'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_menu_items_dish_id', 'menu_items', ['dish_id'],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_menu_items_dish_id', table_name='menu_items',
+            postgresql_concurrently=True,
+        )
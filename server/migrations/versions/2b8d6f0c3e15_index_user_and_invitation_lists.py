@@ -0,0 +1,44 @@
+"""index user and invitation lists
+
+Revision ID: 2b8d6f0c3e15
+Revises: 4a6c1e3f9d27
+Create Date: 2026-10-16 18:02:11.540218
+
+The admin user list filters on restaurant_id IN (...) and orders by
+created_at; the invitation list adds link_type = 'invite'. Composite
+indexes let both read rows in order instead of sorting the table. A
+B-tree scans backwards, so no DESC column is needed; audit_logs already
+has (action, created_at). Built CONCURRENTLY.
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '2b8d6f0c3e15'
+down_revision = '4a6c1e3f9d27'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_users_restaurant_id_created_at', 'users', ['restaurant_id', 'created_at'],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_activation_links_restaurant_id_link_type_created_at', 'activation_links',
+            ['restaurant_id', 'link_type', 'created_at'],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_activation_links_restaurant_id_link_type_created_at', table_name='activation_links',
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_users_restaurant_id_created_at', table_name='users',
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,39 @@
+"""push_subscriptions partial indexes
+
+Revision ID: 4a6c1e3f9d27
+Revises: 7d2f5b8e1a93
+Create Date: 2026-10-16 16:47:19.318264
+
+Partial indexes for the notification scheduler: the per-minute lookups
+of today / tomorrow menu subscribers by notification time, and the event
+fan-out by restaurant. Only opted-in rows are indexed. Built CONCURRENTLY.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '4a6c1e3f9d27'
+down_revision = '7d2f5b8e1a93'
+branch_labels = None
+depends_on = None
+
+_INDEXES = (
+    ('ix_push_subscriptions_today_menu_time', 'notify_today_menu_time', 'notify_today_menu'),
+    ('ix_push_subscriptions_tomorrow_menu_time', 'notify_tomorrow_menu_time', 'notify_tomorrow_menu'),
+    ('ix_push_subscriptions_events_restaurant_id', 'restaurant_id', 'notify_events'),
+)
+
+
+def upgrade():
+    with op.get_context().autocommit_block():
+        for name, column, flag in _INDEXES:
+            op.create_index(name, 'push_subscriptions', [column],
+                            postgresql_where=sa.text(flag),
+                            postgresql_concurrently=True)
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        for name, _column, _flag in _INDEXES:
+            op.drop_index(name, table_name='push_subscriptions',
+                          postgresql_concurrently=True)
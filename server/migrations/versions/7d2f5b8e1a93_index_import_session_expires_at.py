@@ -0,0 +1,24 @@
+"""index import_session expires_at
+
+Revision ID: 7d2f5b8e1a93
+Revises: 0b9e4d7a2c61
+Create Date: 2026-10-16 16:08:30.551872
+
+Index on import_session(expires_at): every CSV upload first purges the
+expired sessions with DELETE ... WHERE expires_at < now.
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '7d2f5b8e1a93'
+down_revision = '0b9e4d7a2c61'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index('ix_import_session_expires_at', 'import_session', ['expires_at'])
+
+
+def downgrade():
+    op.drop_index('ix_import_session_expires_at', table_name='import_session')
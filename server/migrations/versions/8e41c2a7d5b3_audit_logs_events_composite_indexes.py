@@ -0,0 +1,35 @@
+"""audit_logs and events composite indexes
+
+Revision ID: 8e41c2a7d5b3
+Revises: 351ae1c6c787
+Create Date: 2026-10-16 09:12:04.512337
+
+Composite indexes matching the hot query shapes: audit log lists filtered by
+user or action and sorted by date, and a restaurant's upcoming events.
+Built CONCURRENTLY so the tables stay writable during the migration.
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '8e41c2a7d5b3'
+down_revision = '351ae1c6c787'
+branch_labels = None
+depends_on = None
+
+_INDEXES = (
+    ('ix_audit_logs_user_id_created_at', 'audit_logs', ['user_id', 'created_at']),
+    ('ix_audit_logs_action_created_at', 'audit_logs', ['action', 'created_at']),
+    ('ix_events_restaurant_id_event_date_status', 'events', ['restaurant_id', 'event_date', 'status']),
+)
+
+
+def upgrade():
+    with op.get_context().autocommit_block():
+        for name, table, columns in _INDEXES:
+            op.create_index(name, table, columns, postgresql_concurrently=True)
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        for name, table, _columns in _INDEXES:
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
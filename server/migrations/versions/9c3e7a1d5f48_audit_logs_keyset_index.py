@@ -0,0 +1,42 @@
+"""audit_logs keyset index
+
+Revision ID: 9c3e7a1d5f48
+Revises: 2b8d6f0c3e15
+Create Date: 2026-10-16 19:12:40.318027
+
+The audit log list orders by (created_at, id) and pages on
+(created_at, id) < cursor. A composite index serves both the order and
+the row-value seek; it replaces the single-column index on created_at,
+which it covers as a prefix. Built CONCURRENTLY.
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '9c3e7a1d5f48'
+down_revision = '2b8d6f0c3e15'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_audit_logs_created_at_id', 'audit_logs', ['created_at', 'id'],
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_audit_logs_created_at', table_name='audit_logs',
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_audit_logs_created_at', 'audit_logs', ['created_at'],
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_audit_logs_created_at_id', table_name='audit_logs',
+            postgresql_concurrently=True,
+        )
@@ -155,23 +155,23 @@ def upgrade():
         sa.column('certification_id', sa.String), sa.column('keyword', sa.String))
 
     # Insert categories
-    op.bulk_insert(tag_cat_t, DIETARY_TAG_CATEGORIES)
-    op.bulk_insert(cert_cat_t, CERTIFICATION_CATEGORIES)
+    op.bulk_insert(tag_cat_t, [c._asdict() for c in DIETARY_TAG_CATEGORIES])
+    op.bulk_insert(cert_cat_t, [c._asdict() for c in CERTIFICATION_CATEGORIES])
 
     # Insert tags
     op.bulk_insert(tag_t, [{
-        'id': t['id'], 'label': t['label'], 'icon': t['icon'],
-        'color': t['color'], 'category_id': t['category_id'],
-        'sort_order': t['sort_order'],
+        'id': t.id, 'label': t.label, 'icon': t.icon,
+        'color': t.color, 'category_id': t.category_id,
+        'sort_order': t.sort_order,
     } for t in DIETARY_TAGS])
 
     # Insert certifications
     op.bulk_insert(cert_t, [{
-        'id': c['id'], 'name': c['name'], 'official_name': c['official_name'],
-        'issuer': c['issuer'], 'scheme_type': c['scheme_type'],
-        'jurisdiction': c['jurisdiction'], 'guarantee': c['guarantee'],
-        'logo_filename': c['logo_filename'], 'category_id': c['category_id'],
-        'sort_order': c['sort_order'],
+        'id': c.id, 'name': c.name, 'official_name': c.official_name,
+        'issuer': c.issuer, 'scheme_type': c.scheme_type,
+        'jurisdiction': c.jurisdiction, 'guarantee': c.guarantee,
+        'logo_filename': c.logo_filename, 'category_id': c.category_id,
+        'sort_order': c.sort_order,
     } for c in CERTIFICATIONS])
 
     # Insert keywords
@@ -0,0 +1,40 @@
+"""import_session columns/rows as native JSON
+
+Revision ID: c5f1d9a04e2b
+Revises: 8e41c2a7d5b3
+Create Date: 2026-10-16 14:03:51.204118
+
+The parsed CSV payload was stored as TEXT and decoded by hand on every
+read. A JSON column lets the driver decode it once when the row is loaded.
+JSON rather than JSONB keeps each row's keys in CSV column order.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'c5f1d9a04e2b'
+down_revision = '8e41c2a7d5b3'
+branch_labels = None
+depends_on = None
+
+_COLUMNS = ('columns', 'rows')
+
+
+def upgrade():
+    with op.batch_alter_table('import_session', schema=None) as batch_op:
+        for column in _COLUMNS:
+            batch_op.alter_column(column,
+                                  existing_type=sa.Text(),
+                                  type_=sa.JSON(),
+                                  existing_nullable=False,
+                                  postgresql_using=f'"{column}"::json')
+
+
+def downgrade():
+    with op.batch_alter_table('import_session', schema=None) as batch_op:
+        for column in _COLUMNS:
+            batch_op.alter_column(column,
+                                  existing_type=sa.JSON(),
+                                  type_=sa.Text(),
+                                  existing_nullable=False,
+                                  postgresql_using=f'"{column}"::text')
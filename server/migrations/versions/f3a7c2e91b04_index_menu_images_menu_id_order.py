@@ -0,0 +1,33 @@
+"""index menu_images menu_id order
+
+Revision ID: f3a7c2e91b04
+Revises: c5f1d9a04e2b
+Create Date: 2026-10-16 14:40:12.880913
+
+Composite index on menu_images(menu_id, "order"): Menu.to_dict and the
+upload limit check read a menu's images by menu_id, sorted by order, and
+the table had no index on menu_id at all. Built CONCURRENTLY.
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'f3a7c2e91b04'
+down_revision = 'c5f1d9a04e2b'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_menu_images_menu_id_order', 'menu_images', ['menu_id', 'order'],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_menu_images_menu_id_order', table_name='menu_images',
+            postgresql_concurrently=True,
+        )
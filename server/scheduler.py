@@ -2,21 +2,41 @@
 
 The web (gunicorn) workers never run the scheduler; this single process does, so
 scheduled push notifications are sent exactly once. Started by the compose
-`scheduler` service with ENABLE_SCHEDULER=1.
+`scheduler` service.
+
+It is a plain loop around the `flask notify-tick` job: no APScheduler thread.
+Where an OS-level scheduler is available, `* * * * * flask notify-tick` (cron,
+systemd timer, Kubernetes CronJob) can replace this process entirely.
 """
 import os
 import time
 
 from app import create_app
 
-# Ensure the scheduler is enabled even if the env var was not set on the service.
-os.environ.setdefault('ENABLE_SCHEDULER', '1')
+# The in-process APScheduler is for local dev only; this loop replaces it.
+os.environ['ENABLE_SCHEDULER'] = '0'
 
-app = create_app()
+# No HTTP traffic here: skip the API blueprints (and Flask-Smorest) entirely.
+app = create_app(register_routes=False)
+
+
+def run_forever():
+    """Run the notification job at the start of every minute."""
+    if not os.environ.get('VAPID_PRIVATE_KEY', ''):
+        app.logger.info('VAPID_PRIVATE_KEY unset — scheduled notifications disabled')
+        while True:
+            time.sleep(3600)
+
+    from app.services.notification_service import check_and_send_notifications
 
-if __name__ == '__main__':
     app.logger.info('Scheduler process started')
-    # create_app() starts the BackgroundScheduler (daemon thread); keep the main
-    # thread alive so the process does not exit.
     while True:
-        time.sleep(3600)
+        time.sleep(60 - time.time() % 60)
+        try:
+            check_and_send_notifications(app)
+        except Exception:
+            app.logger.exception('Scheduled notification run failed')
+
+
+if __name__ == '__main__':
+    run_forever()
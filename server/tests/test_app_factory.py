@@ -0,0 +1,177 @@
+"""Application factory tests: optional HTTP layer, static endpoints, scheduler lock, CORS, JWT rejections."""
+import os
+
+from app import create_app
+
+
+class TestCreateApp:
+    def test_api_routes_registered_by_default(self, app):
+        rules = {r.rule for r in app.url_map.iter_rules()}
+        assert '/v1/auth/login' in rules
+        assert '/health' in rules
+
+    def test_factory_does_not_touch_the_database(self, app, monkeypatch):
+        # Schema is owned by Alembic (flask db upgrade): building an app must not
+        # open a connection (no create_all / DDL probe on worker boot).
+        monkeypatch.setenv('DATABASE_URL', 'postgresql://nobody:x@127.0.0.1:1/unreachable')
+        bare = create_app()
+        assert bare.config['SQLALCHEMY_DATABASE_URI'].endswith('/unreachable')
+
+    def test_mappers_configured_at_startup(self, app):
+        from app.models import Event, Menu, User
+
+        assert all(model.__mapper__.configured for model in (Event, Menu, User))
+
+    def test_json_keys_keep_insertion_order(self, app):
+        with app.app_context():
+            body = app.json.dumps({'b': 1, 'a': 2})
+        assert body.index('"b"') < body.index('"a"')
+
+    def test_scheduler_app_has_no_api_routes(self, app):
+        bare = create_app(register_routes=False)
+        rules = {r.rule for r in bare.url_map.iter_rules()}
+        assert not any(rule.startswith('/v1') for rule in rules)
+        assert '/health' in rules
+
+
+class TestRobotsTxt:
+    def test_robots_is_cacheable_plain_text(self, client):
+        res = client.get('/robots.txt')
+        assert res.status_code == 200
+        assert res.mimetype == 'text/plain'
+        assert res.headers['Cache-Control'] == 'public, max-age=86400'
+        assert b'User-agent: CCBot\nDisallow: /' in res.data
+
+
+class TestStaticShortcuts:
+    def test_health_skips_flask_dispatch(self, app, client, monkeypatch):
+        seen = []
+        monkeypatch.setattr(app, 'full_dispatch_request', lambda: seen.append(True))
+        res = client.get('/health')
+        assert res.status_code == 200
+        assert res.get_json()['status'] == 'healthy'
+        assert seen == []
+
+    def test_head_has_headers_but_no_body(self, client):
+        res = client.head('/robots.txt')
+        assert res.status_code == 200
+        assert int(res.headers['Content-Length']) > 0
+        assert res.data == b''
+
+    def test_other_methods_reach_flask(self, client):
+        assert client.post('/health').status_code == 405
+
+
+class TestSchedulerLock:
+    def test_only_one_process_holds_the_lock(self, tmp_path, monkeypatch):
+        from flask import Flask
+
+        from app import _acquire_scheduler_lock
+
+        monkeypatch.setenv('SCHEDULER_LOCK_FILE', str(tmp_path / 'scheduler.lock'))
+        first, second = Flask('first'), Flask('second')
+        try:
+            assert _acquire_scheduler_lock(first) is True
+            # flock is per open file description: a second open is refused too.
+            assert _acquire_scheduler_lock(second) is False
+            assert 'scheduler_lock' not in second.extensions
+        finally:
+            os.close(first.extensions['scheduler_lock'])
+
+
+class TestCorsOrigins:
+    def test_exact_origins_are_stripped_and_deduplicated(self):
+        from app import _parse_cors_origins
+
+        assert _parse_cors_origins(' http://localhost:5173/ ,http://localhost:5173,,') == [
+            'http://localhost:5173'
+        ]
+
+    def test_wildcard_subdomains_become_one_regex(self):
+        from app import _parse_cors_origins
+
+        origins = _parse_cors_origins('https://mariam.app,https://*.mariam.app,https://*.ru.fr')
+        assert origins[0] == 'https://mariam.app'
+        pattern = origins[1]
+        assert len(origins) == 2
+        assert pattern.match('https://demo.mariam.app')
+        assert pattern.match('https://Crous-Lyon.ru.fr')
+        assert not pattern.match('https://evil.com/.mariam.app')
+        assert not pattern.match('https://a.b.mariam.app')
+        assert not pattern.match('http://demo.mariam.app')
+
+    def test_preflight_allows_configured_origin(self, client):
+        res = client.options('/v1/auth/login', headers={
+            'Origin': 'http://localhost:5173',
+            'Access-Control-Request-Method': 'POST',
+        })
+        assert res.headers['Access-Control-Allow-Origin'] == 'http://localhost:5173'
+
+    def test_cors_can_be_disabled(self, monkeypatch):
+        monkeypatch.setenv('ENABLE_CORS', '0')
+        res = create_app().test_client().get('/v1/taxonomy', headers={'Origin': 'http://localhost:5173'})
+        assert 'Access-Control-Allow-Origin' not in res.headers
+
+
+class TestJwtRejections:
+    def test_revoked_mfa_pending_token_body(self, app, client):
+        from flask_jwt_extended import create_access_token
+
+        with app.app_context():
+            token = create_access_token(identity='1', additional_claims={'mfa_pending': True})
+        res = client.get('/v1/auth/me', headers={'Authorization': f'Bearer {token}'})
+        assert res.status_code == 401
+        assert res.mimetype == 'application/json'
+        assert res.get_json() == {
+            'error': 'Authentification incomplète',
+            'message': 'Veuillez compléter la vérification MFA',
+        }
+
+
+class TestLimiterStartup:
+    def test_redis_storage_connects_on_first_limited_request(self):
+        from flask import Flask
+        from flask_limiter import Limiter
+
+        app = Flask(__name__)
+        # Nothing listens on port 1: any eager connection would fail here.
+        limiter = Limiter(key_func=lambda: 'test', storage_uri='redis://127.0.0.1:1/0',
+                          default_limits=['1 per minute'], swallow_errors=False)
+        limiter.init_app(app)
+
+        @app.route('/health')
+        @limiter.exempt
+        def health():
+            return 'ok'
+
+        assert app.test_client().get('/health').status_code == 200
+
+
+class TestNotifyTickCommand:
+    def test_skips_without_vapid_key(self, app, monkeypatch):
+        monkeypatch.delenv('VAPID_PRIVATE_KEY', raising=False)
+        result = app.test_cli_runner().invoke(args=['notify-tick'])
+        assert result.exit_code == 0
+        assert 'VAPID_PRIVATE_KEY unset' in result.output
+
+    def test_runs_notification_job(self, app, monkeypatch):
+        from app.services import notification_service
+
+        calls = []
+        monkeypatch.setenv('VAPID_PRIVATE_KEY', 'test-key')
+        monkeypatch.setattr(notification_service, 'check_and_send_notifications', calls.append)
+        result = app.test_cli_runner().invoke(args=['notify-tick'])
+        assert result.exit_code == 0
+        assert calls == [app]
+
+
+class TestSeedCommand:
+    def test_seed_is_idempotent(self, app):
+        from app.data.taxonomy import CERTIFICATION_KEYWORDS, DIETARY_TAG_KEYWORDS
+        from app.models import CertificationKeyword, DietaryTagKeyword
+
+        for _ in range(2):
+            result = app.test_cli_runner().invoke(args=['seed'])
+            assert result.exit_code == 0, result.output
+        assert DietaryTagKeyword.query.count() == sum(map(len, DIETARY_TAG_KEYWORDS.values()))
+        assert CertificationKeyword.query.count() == sum(map(len, CERTIFICATION_KEYWORDS.values()))
@@ -20,6 +20,38 @@ class TestLogin:
         assert 'refresh_token' in data
         assert data['user']['email'] == 'admin@mariam.app'
 
+    def test_login_upgrades_legacy_password_hash(self, app, client):
+        from werkzeug.security import generate_password_hash
+
+        from app.models import User
+        from app.models.user import PASSWORD_HASH_METHOD
+
+        make_restaurant(app)
+        make_user(app)
+        user = User.query.filter_by(email='admin@mariam.app').first()
+        user.password_hash = generate_password_hash(TEST_PASSWORD, method='pbkdf2:sha256:500')
+        db.session.commit()
+
+        res = client.post('/v1/auth/login', json={'email': 'admin@mariam.app', 'password': TEST_PASSWORD})
+        assert res.status_code == 200
+        db.session.expire_all()
+        user = User.query.filter_by(email='admin@mariam.app').first()
+        assert user.password_hash.startswith(PASSWORD_HASH_METHOD + '$')
+        assert user.check_password(TEST_PASSWORD)
+
+    def test_shorthand_hash_method_needs_no_rehash(self, app, monkeypatch):
+        from werkzeug.security import generate_password_hash
+
+        from app.models import User
+        from app.models import user as user_module
+
+        # Werkzeug stocke 'pbkdf2' sous sa forme développée 'pbkdf2:sha256:600000'
+        monkeypatch.setattr(user_module, 'PASSWORD_HASH_METHOD', 'pbkdf2')
+        user = User(password_hash=generate_password_hash(TEST_PASSWORD, method='pbkdf2'))
+        assert not user.password_needs_rehash()
+        user.password_hash = generate_password_hash(TEST_PASSWORD, method='pbkdf2:sha256:500')
+        assert user.password_needs_rehash()
+
     def test_login_wrong_password(self, app, client):
         make_restaurant(app)
         make_user(app)
@@ -43,6 +43,17 @@ class TestCatalogCrud:
         names = {d['name'] for d in res.get_json()['dishes']}
         assert names == {'Poulet rôti', 'Riz pilaf'}
 
+    def test_search_folds_ligatures(self, app, client):
+        make_restaurant(app)
+        make_user(app)
+        token = get_token(client)
+        # Ligature « ﬁ » fréquente dans les menus copiés depuis un PDF
+        dish_id = _create_dish(client, token, name='Saumon en ﬁlet').get_json()['dish']['id']
+        _create_dish(client, token, name='Riz pilaf')
+        res = client.get('/v1/catalog?q=filet', headers=auth_headers(token))
+        assert res.status_code == 200
+        assert [d['id'] for d in res.get_json()['dishes']] == [dish_id]
+
     def test_get_dish(self, app, client):
         make_restaurant(app)
         make_user(app)
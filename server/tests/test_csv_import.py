@@ -95,6 +95,21 @@ class TestCsvImport:
         dishes = client.get('/v1/catalog', headers=auth_headers(token)).get_json()['dishes']
         assert len(dishes) == 2
 
+    def test_expired_session_not_returned(self, app, client):
+        from app.extensions import db
+        from app.models import ImportSession, User
+
+        make_restaurant(app)
+        make_user(app)
+        token = get_token(client)
+        file_id = _upload_csv(client, token).get_json()['file_id']
+        user_id = User.query.filter_by(email='admin@mariam.app').first().id
+        assert ImportSession.get_valid(file_id, user_id) is not None
+
+        ImportSession.query.get(file_id).expires_at -= datetime.timedelta(hours=1)
+        db.session.commit()
+        assert ImportSession.get_valid(file_id, user_id) is None
+
 
 # ============================================================
 # Import du catalogue de plats (liste)
@@ -288,3 +303,41 @@ class TestCatalogImportTenantIsolation:
             'file_id': file_id, 'name_column': 'Nom', 'category_id': category_a,
         }, headers=auth_headers(token_b))
         assert res.status_code == 400  # catégorie introuvable pour ce restaurant
+
+
+class TestKeywordMatcher:
+    def test_detects_every_contained_keyword(self):
+        from app.services.csv_import import KeywordMatcher
+
+        matcher = KeywordMatcher(
+            [('végétarien', 'vegetarian'), ('bio', 'organic_tag'), ('sans gluten', 'gluten_free')],
+            [('bio', 'ab'), ('label rouge', 'label_rouge')],
+        )
+        assert matcher.detect('Gratin VÉGÉTARIEN bio') == {
+            'tags': ['organic_tag', 'vegetarian'],
+            'certifications': ['ab'],
+        }
+        assert matcher.detect('Poulet rôti') == {'tags': [], 'certifications': []}
+
+    def test_nested_keywords_all_match(self):
+        from app.services.csv_import import KeywordMatcher
+
+        matcher = KeywordMatcher(
+            [('gluten', 'contains_gluten'), ('sans gluten', 'gluten_free'), ('bio', 'organic_tag')],
+            [('biologique', 'ab')],
+        )
+        assert matcher.detect('Pain sans gluten biologique') == {
+            'tags': ['contains_gluten', 'gluten_free', 'organic_tag'],
+            'certifications': ['ab'],
+        }
+        assert KeywordMatcher([], []).detect('bio') == {'tags': [], 'certifications': []}
+
+    def test_matching_ignores_accents(self):
+        from app.services.csv_import import KeywordMatcher
+
+        matcher = KeywordMatcher([('végétarien', 'vegetarian')], [('élevé en plein air', 'plein_air')])
+        assert matcher.detect('Lasagnes vegetariennes, oeufs eleves en plein air') == {
+            'tags': ['vegetarian'],
+            'certifications': [],
+        }
+        assert matcher.detect('Œufs ÉLEVÉ EN PLEIN AIR')['certifications'] == ['plein_air']
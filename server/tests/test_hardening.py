@@ -1,5 +1,9 @@
 """Backend hardening tests: opt-in pagination and auth hardening."""
+import time
+from datetime import timedelta
+
 import pyotp
+import pytest
 
 from app.extensions import db
 from app.models import User
@@ -35,6 +39,43 @@ class TestPagination:
         body = client.get('/v1/users?page=1&per_page=9999', headers=auth_headers(token)).get_json()
         assert body['per_page'] == 200
 
+    def test_users_keyset_pagination_walks_all_pages(self, app, client):
+        make_user(None, email='padmin@mariam.app', role='admin')
+        for i in range(4):
+            make_user(None, email=f'u{i}@mariam.app', role='editor')
+        token = get_token(client, email='padmin@mariam.app')
+
+        seen, cursor = [], ''
+        while cursor is not None:
+            body = client.get(f'/v1/users?cursor={cursor}&limit=2', headers=auth_headers(token)).get_json()
+            assert 'total' not in body
+            assert len(body['users']) <= 2
+            assert body['has_more'] is (body['next_cursor'] is not None)
+            seen += [u['email'] for u in body['users']]
+            cursor = body['next_cursor']
+
+        full = client.get('/v1/users', headers=auth_headers(token)).get_json()['users']
+        assert seen == [u['email'] for u in full]
+        assert len(seen) == 5
+
+    def test_invalid_cursor_rejected(self, app, client):
+        make_user(None, email='padmin@mariam.app', role='admin')
+        token = get_token(client, email='padmin@mariam.app')
+        res = client.get('/v1/users?cursor=not-a-cursor', headers=auth_headers(token))
+        assert res.status_code == 400
+
+    def test_well_formed_cursor_with_wrong_types_rejected(self, app, client):
+        import base64
+        import json
+
+        make_user(None, email='padmin@mariam.app', role='admin')
+        token = get_token(client, email='padmin@mariam.app')
+        for values in (['2024-01-01T00:00:00', 'abc'], ['2024-01-01T00:00:00', {'a': 1}],
+                       ['2024-01-01T00:00:00', True], [[1], 1]):
+            cursor = base64.urlsafe_b64encode(json.dumps(values).encode()).decode()
+            res = client.get(f'/v1/users?cursor={cursor}', headers=auth_headers(token))
+            assert res.status_code == 400, values
+
 
 class TestLoginHardening:
     def test_unknown_email_and_wrong_password_are_indistinguishable(self, app, client):
@@ -87,3 +128,49 @@ class TestMfaTokenSingleUse:
         replay = client.post('/v1/auth/mfa/verify',
                             json={'mfa_token': mfa_token, 'code': pyotp.TOTP(secret).now()})
         assert replay.status_code == 401
+
+
+class TestVerifiedTokenCache:
+    def _count_full_decodes(self, monkeypatch):
+        from flask_jwt_extended import JWTManager
+
+        calls = []
+        original = JWTManager._decode_jwt_from_config
+
+        def counting(self, *args, **kwargs):
+            calls.append(args[0])
+            return original(self, *args, **kwargs)
+
+        monkeypatch.setattr(JWTManager, '_decode_jwt_from_config', counting)
+        return calls
+
+    def test_same_token_verified_once(self, app, monkeypatch):
+        from flask_jwt_extended import create_access_token, decode_token
+
+        calls = self._count_full_decodes(monkeypatch)
+        token = create_access_token(identity='42', expires_delta=timedelta(minutes=5))
+        assert decode_token(token)['sub'] == '42'
+        assert decode_token(token)['sub'] == '42'
+        assert calls == [token]
+
+    def test_cached_token_rechecked_after_expiry(self, app, monkeypatch):
+        from flask_jwt_extended import create_access_token, decode_token
+
+        calls = self._count_full_decodes(monkeypatch)
+        token = create_access_token(identity='42', expires_delta=timedelta(seconds=30))
+        decode_token(token)
+        later = time.time() + 60
+        monkeypatch.setattr('app.extensions.time.time', lambda: later)
+        decode_token(token)  # past `exp` for the cache: full verification again
+        assert len(calls) == 2
+
+    def test_forged_payload_rejected_after_genuine_token_cached(self, app):
+        from flask_jwt_extended import create_access_token, decode_token
+        from jwt import InvalidSignatureError
+
+        genuine = create_access_token(identity='42')
+        decode_token(genuine)
+        header, _, signature = genuine.split('.')
+        other_payload = create_access_token(identity='1').split('.')[1]
+        with pytest.raises(InvalidSignatureError):
+            decode_token(f'{header}.{other_payload}.{signature}')
@@ -3,7 +3,7 @@ Tests de gestion des menus : création, publication, brouillon.
 """
 import datetime
 import pytest
-from conftest import make_restaurant, make_user, make_category, get_token, auth_headers
+from conftest import make_restaurant, make_user, make_category, get_token, auth_headers, count_queries
 
 
 def _today_iso():
@@ -102,6 +102,46 @@ class TestGetMenus:
                          headers=auth_headers(token))
         assert res.status_code in (200, 404)
 
+    def test_menu_dishes_taxonomy_loaded_in_one_batch(self, app, client):
+        from app.extensions import db
+
+        restaurant_id = make_restaurant(app)
+        make_user(app)
+        token = get_token(client)
+        category_id = make_category(app, restaurant_id)
+        client.post('/v1/menus', json={'date': _today_iso(), 'items': [
+            {'category_id': category_id, 'name': f'Plat {i}'} for i in range(3)
+        ]}, headers=auth_headers(token))
+        db.session.expunge_all()
+
+        with count_queries('dish_dietary_tags|dish_certifications') as tag_selects:
+            res = client.get(f'/v1/menus/by-date/{_today_iso()}', headers=auth_headers(token))
+
+        assert len(res.get_json()['menu']['items']) == 3
+        assert len(tag_selects) == 2
+
+    def test_menu_list_loads_items_in_one_batch(self, app, client):
+        from app.extensions import db
+
+        restaurant_id = make_restaurant(app)
+        make_user(app)
+        token = get_token(client)
+        category_id = make_category(app, restaurant_id)
+        for offset in range(3):
+            day = (datetime.date.today() + datetime.timedelta(days=offset)).isoformat()
+            client.post('/v1/menus', json={'date': day, 'items': [
+                {'category_id': category_id, 'name': f'Plat {offset}-{i}', 'order': 1 - i} for i in range(2)
+            ]}, headers=auth_headers(token))
+        db.session.expunge_all()
+
+        with count_queries('FROM menu_items') as item_selects:
+            res = client.get('/v1/menus', headers=auth_headers(token))
+
+        menus = res.get_json()['menus']
+        assert len(menus) == 3
+        assert all([item['order'] for item in m['items']] == [0, 1] for m in menus)
+        assert len(item_selects) == 1
+
 
 class TestMenuTenantIsolation:
     """Un éditeur ne peut accéder qu'aux menus de son propre restaurant."""
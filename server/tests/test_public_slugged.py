@@ -8,7 +8,7 @@ import datetime
 
 from app.extensions import db
 from app.models import Menu, Organization, Restaurant
-from conftest import make_restaurant
+from conftest import count_queries, make_restaurant
 
 HOST = {'Host': 'crous-test.mariam.app'}
 
@@ -47,6 +47,40 @@ class TestPublicMenuResolution:
         assert res.status_code == 200
         assert res.get_json()['restaurant']['code'] == 'EFREI'
 
+    def test_restaurant_config_revalidated_with_etag(self, app, client):
+        _, rid = _org_with_restaurant()
+        res = client.get('/v1/public/efrei/restaurant', headers=HOST)
+        etag = res.headers['ETag']
+        again = client.get('/v1/public/efrei/restaurant', headers={**HOST, 'If-None-Match': etag})
+        assert again.status_code == 304
+        assert again.data == b''
+
+        Restaurant.query.get(rid).name = 'EFREI Villejuif'
+        db.session.commit()
+        changed = client.get('/v1/public/efrei/restaurant', headers={**HOST, 'If-None-Match': etag})
+        assert changed.status_code == 200
+        assert changed.headers['ETag'] != etag
+
+    def test_week_loads_menus_in_one_query(self, app, client):
+        from app.utils.time import paris_today
+
+        _, rid = _org_with_restaurant()
+        monday = paris_today() - datetime.timedelta(days=paris_today().weekday())
+        db.session.add_all([
+            Menu(restaurant_id=rid, date=monday, status='published'),
+            Menu(restaurant_id=rid, date=monday + datetime.timedelta(days=1), status='published'),
+            Menu(restaurant_id=rid, date=monday + datetime.timedelta(days=2), status='draft'),
+        ])
+        db.session.commit()
+
+        with count_queries(r'^\s*SELECT.*FROM menus') as menu_selects:
+            res = client.get('/v1/public/efrei/week', headers=HOST)
+
+        assert res.status_code == 200
+        days = res.get_json()['menus']
+        assert [d['menu'] is not None for d in days.values()] == [True, True] + [False] * 5
+        assert len(menu_selects) == 1
+
     def test_unknown_slug_returns_404(self, app, client):
         _org_with_restaurant()
         res = client.get('/v1/public/nope/today', headers=HOST)
@@ -79,3 +113,26 @@ class TestPublicOtherEndpoints:
         res = client.get('/v1/public/efrei/restaurant', headers=HOST)
         assert res.status_code == 200
         assert res.get_json()['restaurant']['code'] == 'EFREI'
+
+    def test_event_images_loaded_in_one_batch(self, app, client):
+        from app.models import Event, EventImage
+
+        _, rid = _org_with_restaurant()
+        for day in range(3):
+            ev = Event(restaurant_id=rid, title=f'Event {day}', status='published',
+                       event_date=datetime.date.today() + datetime.timedelta(days=day + 1))
+            db.session.add(ev)
+            db.session.flush()
+            for order in (1, 0):
+                db.session.add(EventImage(event_id=ev.id, storage_key=f'k{ev.id}-{order}',
+                                          url=f'https://cdn/{ev.id}/{order}', order=order))
+        db.session.commit()
+        db.session.expunge_all()
+
+        with count_queries('FROM event_images') as image_selects:
+            res = client.get('/v1/public/efrei/events', headers=HOST)
+
+        events = res.get_json()['events']
+        assert len(events) == 3
+        assert all([img['order'] for img in e['images']] == [0, 1] for e in events)
+        assert len(image_selects) == 1
@@ -1,7 +1,7 @@
 """
 Tests de la configuration restaurant : accès refusé sans JWT, CRUD config.
 """
-from conftest import make_restaurant, make_user, get_token, auth_headers
+from conftest import make_restaurant, make_user, get_token, auth_headers, count_queries
 
 
 class TestRestaurantAccess:
@@ -48,3 +48,99 @@ class TestRestaurantUpdate:
                          json={'name': 'Test'},
                          headers=auth_headers(token))
         assert res.status_code == 403
+
+
+class TestDefaultTaxonomyConfig:
+    def test_default_config_matches_model_to_dict(self, app, client):
+        from app.commands.seed import (
+            _upsert_certification_categories,
+            _upsert_certifications,
+            _upsert_dietary_tag_categories,
+            _upsert_dietary_tags,
+        )
+        from app.data.taxonomy import DEFAULT_ENABLED_CERT_IDS, DEFAULT_ENABLED_TAG_IDS
+        from app.extensions import db
+        from app.models import Certification, DietaryTag
+
+        _upsert_dietary_tag_categories()
+        _upsert_dietary_tags()
+        _upsert_certification_categories()
+        _upsert_certifications()
+        db.session.commit()
+        make_restaurant(app)
+        make_user(app)
+        token = get_token(client)
+        config = client.get('/v1/settings', headers=auth_headers(token)).get_json()['restaurant']['config']
+
+        expected_tags = DietaryTag.query.filter(DietaryTag.id.in_(DEFAULT_ENABLED_TAG_IDS)).order_by(DietaryTag.sort_order)
+        expected_certs = Certification.query.filter(
+            Certification.id.in_(DEFAULT_ENABLED_CERT_IDS)).order_by(Certification.sort_order)
+        assert config['dietary_tags'] == [t.to_dict() for t in expected_tags]
+        assert config['certifications'] == [c.to_dict() for c in expected_certs]
+        assert len(config['dietary_tags']) == len(DEFAULT_ENABLED_TAG_IDS)
+
+    def test_default_taxonomy_cache_cleared_on_write(self, app):
+        from app.extensions import db
+        from app.models import DietaryTag, DietaryTagCategory
+        from app.models.restaurant import default_taxonomy_dicts
+
+        assert default_taxonomy_dicts() == ([], [])
+        db.session.add(DietaryTagCategory(id='regime', name='Régime'))
+        db.session.add(DietaryTag(id='vegetarian', label='Végétarien', icon='leaf',
+                                  color='#22c55e', category_id='regime'))
+        db.session.commit()
+        assert [t['id'] for t in default_taxonomy_dicts()[0]] == ['vegetarian']
+
+
+class TestTaxonomyCatalog:
+    def test_taxonomy_loaded_once_and_revalidated(self, app, client):
+        from app.commands.seed import (
+            _upsert_certification_categories,
+            _upsert_certifications,
+            _upsert_dietary_tag_categories,
+            _upsert_dietary_tags,
+        )
+        from app.extensions import db
+
+        _upsert_dietary_tag_categories()
+        _upsert_dietary_tags()
+        _upsert_certification_categories()
+        _upsert_certifications()
+        db.session.commit()
+        db.session.expunge_all()
+
+        with count_queries() as statements:
+            res = client.get('/v1/taxonomy')
+            # Catégories + tags, catégories + certifications
+            assert len(statements) == 4
+            cached = client.get('/v1/taxonomy', headers={'If-None-Match': res.headers['ETag']})
+            assert len(statements) == 4
+
+        data = res.get_json()
+        assert len(data['dietary_tag_categories']) > 1
+        assert all(c['tags'] for c in data['dietary_tag_categories'])
+        assert len(data['certification_categories']) > 1
+        assert cached.status_code == 304
+
+    def test_taxonomy_cache_cleared_on_write(self, app, client):
+        from app.extensions import db
+        from app.models import DietaryTagCategory
+
+        assert client.get('/v1/taxonomy').get_json()['dietary_tag_categories'] == []
+        db.session.add(DietaryTagCategory(id='regime', name='Régime'))
+        db.session.commit()
+        categories = client.get('/v1/taxonomy').get_json()['dietary_tag_categories']
+        assert [c['id'] for c in categories] == ['regime']
+
+    def test_ttl_cache_expires(self, monkeypatch):
+        from app.utils import cache
+
+        calls = []
+        cached = cache.ttl_cache(60)(lambda: calls.append(1) or len(calls))
+        now = [1000.0]
+        monkeypatch.setattr(cache.time, 'monotonic', lambda: now[0])
+        assert cached() == cached() == 1
+        now[0] += 61
+        assert cached() == 2
+        cached.cache_clear()
+        assert cached() == 3
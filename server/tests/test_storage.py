@@ -45,3 +45,52 @@ class TestProcessImage:
         data, filename, content_type = StorageService.process_image(buf.getvalue(), 'logo.png')
         assert content_type == 'image/png'
         assert filename.endswith('.png')
+
+
+class TestLazyClient:
+    def _configured_app(self, app, monkeypatch):
+        for key, value in (
+            ('S3_ENDPOINT_URL', 'http://minio.invalid:9000/'),
+            ('S3_ACCESS_KEY_ID', 'key'),
+            ('S3_SECRET_ACCESS_KEY', 'secret'),
+            ('S3_PUBLIC_URL', ''),
+        ):
+            monkeypatch.setitem(app.config, key, value)
+        return app
+
+    def test_init_app_does_not_build_client(self, app, monkeypatch):
+        import boto3
+
+        def _fail(*args, **kwargs):
+            raise AssertionError('boto3 client built during init_app')
+
+        monkeypatch.setattr(boto3, 'client', _fail)
+        service = StorageService(self._configured_app(app, monkeypatch))
+        assert service.is_configured
+        assert service.get_public_url('a.webp') == 'http://minio.invalid:9000/mariam-uploads/a.webp'
+
+    def test_client_built_once_on_first_use(self, app, monkeypatch):
+        import boto3
+
+        calls = []
+
+        class _FakeClient:
+            def head_bucket(self, Bucket):
+                calls.append(('head_bucket', Bucket))
+
+        def _client(service_name, **kwargs):
+            calls.append(('client', kwargs['endpoint_url']))
+            return _FakeClient()
+
+        monkeypatch.setattr(boto3, 'client', _client)
+        service = StorageService(self._configured_app(app, monkeypatch))
+        assert calls == []
+        assert service.client is service.client
+        assert calls == [('client', 'http://minio.invalid:9000/'), ('head_bucket', 'mariam-uploads')]
+
+    def test_unconfigured_has_no_client(self, app, monkeypatch):
+        for key in ('S3_ENDPOINT_URL', 'S3_ACCESS_KEY_ID', 'S3_SECRET_ACCESS_KEY'):
+            monkeypatch.setitem(app.config, key, None)
+        service = StorageService(app)
+        assert not service.is_configured
+        assert service.client is None
@@ -7,12 +7,13 @@ revocation, org_admin scoping, and removal of the "first active restaurant"
 fallback.
 """
 import datetime
+import math
 
 from flask_jwt_extended import decode_token
 
 from app.extensions import db
 from app.models import Event, ExceptionalClosure, Organization, Restaurant, User
-from conftest import auth_headers, get_token, make_restaurant, make_user
+from conftest import auth_headers, count_queries, get_token, make_restaurant, make_user
 
 
 def _today_iso():
@@ -180,6 +181,106 @@ class TestAuditTenantIsolation:
         assert all(log.get('user_email') != 'b@mariam.app' for log in logs)
         assert any(log.get('user_email') == 'a@mariam.app' for log in logs)
 
+    def test_audit_logs_count_only_for_full_pages(self, app, client):
+        from app.models import AuditLog
+        rid_a, _ = _two_tenants()
+        user = User.query.filter_by(email='a@mariam.app').first()
+        user.mfa_secret = 'JBSWY3DPEHPK3PXP'
+        for _ in range(3):
+            AuditLog.log(action='login', user_id=user.id, restaurant_id=rid_a)
+        db.session.commit()
+        token_a = get_token(client, email='a@mariam.app')
+
+        with count_queries(r'(?i)count\(.*audit_logs') as counts:
+            short = client.get('/v1/audit-logs?per_page=50', headers=auth_headers(token_a)).get_json()
+            assert counts == []
+            full = client.get('/v1/audit-logs?per_page=2', headers=auth_headers(token_a)).get_json()
+            assert len(counts) == 1
+
+        assert short['total'] == len(short['logs']) and short['pages'] == 1
+        # The first GET logged its own access
+        assert full['total'] == short['total'] + 1
+        assert full['pages'] == math.ceil(full['total'] / 2)
+
+    def test_audit_logs_users_loaded_in_one_batch(self, app, client):
+        from app.models import AuditLog
+        rid_a, _ = _two_tenants()
+        admin = User.query.filter_by(email='a@mariam.app').first()
+        admin.mfa_secret = 'JBSWY3DPEHPK3PXP'
+        db.session.commit()
+        token_a = get_token(client, email='a@mariam.app')
+
+        def user_selects_for_listing(n_authors):
+            for i in range(n_authors):
+                author_id = make_user(app, email=f'author{n_authors}-{i}@mariam.app', role='editor',
+                                      restaurant_id=rid_a)
+                AuditLog.log(action='login', user_id=author_id, restaurant_id=rid_a)
+            db.session.commit()
+            db.session.expunge_all()
+            with count_queries('FROM users') as selects:
+                logs = client.get('/v1/audit-logs', headers=auth_headers(token_a)).get_json()['logs']
+            assert {log['user_email'] for log in logs} >= {
+                f'author{n_authors}-{i}@mariam.app' for i in range(n_authors)}
+            return len(selects)
+
+        assert user_selects_for_listing(1) == user_selects_for_listing(4)
+
+    def test_audit_logs_keyset_pagination(self, app, client):
+        from app.models import AuditLog
+        rid_a, _ = _two_tenants()
+        user = User.query.filter_by(email='a@mariam.app').first()
+        user.mfa_secret = 'JBSWY3DPEHPK3PXP'
+        for _ in range(4):
+            AuditLog.log(action='login', user_id=user.id, restaurant_id=rid_a)
+        db.session.commit()
+        token_a = get_token(client, email='a@mariam.app')
+        expected = [
+            log.id for log in AuditLog.query.order_by(AuditLog.created_at.desc(), AuditLog.id.desc())
+        ]
+
+        seen, cursor = [], ''
+        while cursor is not None:
+            body = client.get(f'/v1/audit-logs?cursor={cursor}&limit=2', headers=auth_headers(token_a)).get_json()
+            assert 'total' not in body
+            seen += [log['id'] for log in body['logs']]
+            cursor = body['next_cursor']
+        # Page views are logged too, but they are newer than every cursor
+        assert seen == expected
+
+    def test_audit_export_streams_tenant_rows(self, app, client, monkeypatch):
+        import csv
+        import io
+
+        from app.models import AuditLog
+        from app.routes import audit
+        monkeypatch.setattr(audit, '_EXPORT_BATCH_SIZE', 2)
+        rid_a, rid_b = _two_tenants()
+        user_a = User.query.filter_by(email='a@mariam.app').first()
+        user_a.mfa_secret = 'JBSWY3DPEHPK3PXP'
+        for _ in range(3):
+            AuditLog.log(action='login', user_id=user_a.id, restaurant_id=rid_a)
+        AuditLog.log(action='login', user_id=User.query.filter_by(email='b@mariam.app').first().id,
+                     restaurant_id=rid_b)
+        db.session.commit()
+        token_a = get_token(client, email='a@mariam.app')
+
+        res = client.get('/v1/audit-logs/export', headers=auth_headers(token_a))
+        assert res.status_code == 200
+        assert res.is_streamed
+        assert res.mimetype == 'text/csv'
+        rows = list(csv.reader(io.StringIO(res.get_data(as_text=True))))
+        assert rows[0] == ['ID', 'Date', 'User', 'Action', 'Target', 'IP', 'Details']
+        assert {r[2] for r in rows[1:]} == {'a@mariam.app'}
+        export_entry = AuditLog.query.filter_by(action=AuditLog.ACTION_AUDIT_LOGS_EXPORT).one()
+        assert export_entry.get_details()['count'] == len(rows) - 1
+
+    def test_audit_details_serialization(self, app):
+        from app.models import AuditLog
+        assert AuditLog.log(action='login', details={}).details == '{}'
+        assert AuditLog.log(action='login', details=None).details is None
+        assert AuditLog.log(action='login', details='{"a":1}').get_details() == {'a': 1}
+        assert AuditLog.log(action='login', details=b'{"a":1}').details == '{"a":1}'
+
 
 class TestTokenRevocation:
     def test_token_rejected_after_revocation(self, app, client):
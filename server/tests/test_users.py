@@ -2,7 +2,7 @@
 Tests de gestion des utilisateurs : création, rôles, désactivation.
 Seul un admin peut gérer les autres utilisateurs.
 """
-from conftest import make_restaurant, make_user, get_token, auth_headers, TEST_PASSWORD
+from conftest import make_restaurant, make_user, get_token, auth_headers, count_queries, TEST_PASSWORD
 
 
 class TestListUsers:
@@ -27,6 +27,38 @@ class TestListUsers:
         assert isinstance(users, list)
         assert len(users) >= 1
 
+    def test_list_users_includes_passkeys_count(self, app, client):
+        from app.extensions import db
+        from app.models import Passkey
+        make_restaurant(app)
+        admin_id = make_user(app, role='admin')
+        make_user(app, email='editor@mariam.app', role='editor')
+        token = get_token(client)
+        for i in range(2):
+            db.session.add(Passkey(
+                user_id=admin_id, credential_id=bytes([i]), public_key=b'pk', sign_count=0,
+            ))
+        db.session.commit()
+        res = client.get('/v1/users', headers=auth_headers(token))
+        assert res.status_code == 200
+        counts = {u['email']: u['passkeys_count'] for u in res.get_json()['users']}
+        assert counts == {'admin@mariam.app': 2, 'editor@mariam.app': 0}
+
+    def test_admin_caller_loaded_once_without_secrets(self, app, client):
+        from app.extensions import db
+
+        make_restaurant(app)
+        make_user(app, role='admin')
+        token = get_token(client)
+        db.session.expunge_all()
+
+        with count_queries('FROM users') as user_selects:
+            res = client.get('/v1/users/invitations', headers=auth_headers(token))
+
+        assert res.status_code == 200
+        assert len(user_selects) == 1
+        assert 'mfa_secret' not in user_selects[0]
+
 
 class TestInviteUser:
     def test_invite_creates_activation_link(self, app, client):
@@ -81,6 +113,28 @@ class TestDeactivateUser:
         assert res.status_code in (400, 403)
 
 
+class TestResetUserMfa:
+    def test_reset_mfa_clears_secret_and_deactivates(self, app, client):
+        from app.extensions import db
+        from app.models import User
+        make_restaurant(app)
+        make_user(app, role='admin', email='admin@mariam.app')
+        editor_id = make_user(app, role='editor', email='editor@test.com')
+        editor = db.session.get(User, editor_id)
+        editor.set_mfa_secret('JBSWY3DPEHPK3PXP')
+        db.session.commit()
+        token = get_token(client)
+        db.session.expunge_all()
+
+        res = client.post(f'/v1/users/{editor_id}/reset-mfa', headers=auth_headers(token))
+        assert res.status_code == 200
+        db.session.expunge_all()
+        editor = db.session.get(User, editor_id)
+        assert editor.mfa_secret is None
+        assert not editor.mfa_enabled
+        assert not editor.is_active
+
+
 class TestRoleManagement:
     def test_change_user_role(self, app, client):
         make_restaurant(app)
@@ -107,3 +161,15 @@ class TestRoleManagement:
         # Role must remain unchanged
         user = db.session.get(User, target_id)
         assert user.role == 'reader'
+
+
+class TestPasswordStrength:
+    def test_each_criterion_is_required(self):
+        from app.models import User
+
+        assert User.validate_password_strength('Abcdefgh123!')
+        assert User.validate_password_strength(TEST_PASSWORD)
+        # 'Ébcdefgh123!' : seules les majuscules ASCII comptent
+        for weak in ('Abcdef123!', 'abcdefgh123!', 'ABCDEFGH123!', 'Abcdefghijk!', 'Abcdefgh1234',
+                     'Ébcdefgh123!'):
+            assert not User.validate_password_strength(weak), weak